@@ -0,0 +1,192 @@
+"""Helpers shared by the fixture generator scripts in cases/."""
+
+import contextlib
+import io
+import re
+import shutil
+import zipfile
+from pathlib import Path
+
+import docx
+from docx.oxml.ns import qn
+from lxml import etree
+
+try:
+    # ISA-L's DEFLATE is a drop-in for zlib's and several times faster; the
+    # archives it writes are equivalent but not byte-identical.
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+# python-docx's bundled blank document, for generators that edit its parts
+# directly instead of going through Document() and a save/re-open round trip.
+TEMPLATE = Path(docx.__file__).parent / "templates" / "default.docx"
+
+# One parser for every part; these edits never use xml:id lookups or entities.
+PARSER = etree.XMLParser(collect_ids=False, resolve_entities=False, no_network=True)
+# compatSetting only ever lives under w:settings/w:compat; no descendant scan.
+_P_COMPAT = etree.XPath("w:compat/w:compatSetting[@w:name='compatibilityMode']", namespaces={"w": WML})
+# The compatibilityMode value is a one-attribute edit, so it is done on the raw
+# bytes; lxml is only the fallback for an unexpected attribute layout.
+_COMPAT_MODE = re.compile(rb'(<w:compatSetting w:name="compatibilityMode"[^>]*w:val=")(\d+)"')
+
+# Clark names used by the paragraph and numbering builders, resolved once
+# instead of calling qn() on every element.
+W_VAL = qn("w:val")
+W_P = qn("w:p")
+W_P_PR = qn("w:pPr")
+W_P_STYLE = qn("w:pStyle")
+W_R = qn("w:r")
+W_T = qn("w:t")
+W_SECT_PR = qn("w:sectPr")
+W_NUM_PR = qn("w:numPr")
+W_ILVL = qn("w:ilvl")
+W_NUM_ID = qn("w:numId")
+W_ABSTRACT_NUM = qn("w:abstractNum")
+W_ABSTRACT_NUM_ID = qn("w:abstractNumId")
+W_MULTI_LEVEL_TYPE = qn("w:multiLevelType")
+W_LVL = qn("w:lvl")
+W_START = qn("w:start")
+W_NUM_FMT = qn("w:numFmt")
+W_LVL_TEXT = qn("w:lvlText")
+W_LVL_JC = qn("w:lvlJc")
+W_IND = qn("w:ind")
+W_LEFT = qn("w:left")
+W_HANGING = qn("w:hanging")
+W_NUM = qn("w:num")
+
+# Fixed attribute dicts shared by every abstractNum level; SubElement copies
+# attrib, so the dicts are safe to reuse.
+_MULTILEVEL = {W_VAL: "hybridMultilevel"}
+_LVL_JC_LEFT = {W_VAL: "left"}
+
+
+def set_compat_mode(settings, mode=b"15"):
+    """settings.xml bytes with compatibilityMode set to mode, or None if it already is."""
+    m = _COMPAT_MODE.search(settings)
+    if m is not None:
+        if m.group(2) == mode:
+            return None
+        return settings[:m.start(2)] + mode + settings[m.end(2):]
+    tree = etree.fromstring(settings, PARSER)
+    for compat_setting in _P_COMPAT(tree):
+        compat_setting.set(W_VAL, mode.decode())
+    return etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def set_document_compat_mode(doc, mode="15"):
+    """Set compatibilityMode on a python-docx Document's in-memory settings part.
+
+    The default template is Word 2010 (14); 15 is Word 2013+. Done before
+    doc.save() so the saved docx needs no post-processing.
+    """
+    for compat_setting in _P_COMPAT(doc.settings.element):
+        compat_setting.set(W_VAL, mode)
+
+
+def serialize(element):
+    """The part XML for element's tree, written straight into a buffer."""
+    buf = io.BytesIO()
+    element.getroottree().write(buf, xml_declaration=True, encoding="UTF-8", standalone=True)
+    return buf.getbuffer()
+
+
+def add_abstract_num(numbering, abstract_num_id, levels, before=None):
+    el = etree.SubElement(numbering, W_ABSTRACT_NUM, {W_ABSTRACT_NUM_ID: str(abstract_num_id)})
+    etree.SubElement(el, W_MULTI_LEVEL_TYPE, _MULTILEVEL)
+    for ilvl, start, num_fmt, lvl_text, left, hanging in levels:
+        lvl = etree.SubElement(el, W_LVL, {W_ILVL: str(ilvl)})
+        etree.SubElement(lvl, W_START, {W_VAL: str(start)})
+        etree.SubElement(lvl, W_NUM_FMT, {W_VAL: num_fmt})
+        etree.SubElement(lvl, W_LVL_TEXT, {W_VAL: lvl_text})
+        etree.SubElement(lvl, W_LVL_JC, _LVL_JC_LEFT)
+        ppr = etree.SubElement(lvl, W_P_PR)
+        etree.SubElement(ppr, W_IND, {W_LEFT: str(left), W_HANGING: str(hanging)})
+    # abstractNum definitions must precede every w:num in numbering.xml
+    if before is not None:
+        before.addprevious(el)
+    return el
+
+
+def add_num(numbering, num_id, abstract_num_id):
+    el = etree.SubElement(numbering, W_NUM, {W_NUM_ID: str(num_id)})
+    etree.SubElement(el, W_ABSTRACT_NUM_ID, {W_VAL: str(abstract_num_id)})
+    return el
+
+
+def add_para(body, text, style=None):
+    p = etree.SubElement(body, W_P)
+    if style:
+        ppr = etree.SubElement(p, W_P_PR)
+        etree.SubElement(ppr, W_P_STYLE, {W_VAL: style})
+    r = etree.SubElement(p, W_R)
+    etree.SubElement(r, W_T).text = text
+    return p
+
+
+def add_heading(body, text, level):
+    return add_para(body, text, f"Heading{level}")
+
+
+def add_list_para(body, text, num_id, ilvl):
+    p = etree.SubElement(body, W_P)
+    ppr = etree.SubElement(p, W_P_PR)
+    num_pr = etree.SubElement(ppr, W_NUM_PR)
+    etree.SubElement(num_pr, W_ILVL, {W_VAL: str(ilvl)})
+    etree.SubElement(num_pr, W_NUM_ID, {W_VAL: str(num_id)})
+    r = etree.SubElement(p, W_R)
+    etree.SubElement(r, W_T).text = text
+    return p
+
+
+def add_plain_paragraphs(body, texts):
+    """Append unstyled single-run paragraphs straight onto w:body with lxml."""
+    sect_pr = body.find(W_SECT_PR)
+    for text in texts:
+        p = etree.SubElement(body, W_P)
+        r = etree.SubElement(p, W_R)
+        etree.SubElement(r, W_T).text = text
+    # sectPr has to stay the last child of w:body
+    if sect_pr is not None:
+        body.append(sect_pr)
+
+
+@contextlib.contextmanager
+def _fast_deflate():
+    """Point zipfile at ISA-L's DEFLATE for the duration of the block, if installed.
+
+    Scoped rather than set at import so python-docx's own saves, and other
+    scripts sharing a regen worker, keep stock zlib.
+    """
+    if isal_zlib is None:
+        yield
+        return
+    saved = zipfile.zlib
+    zipfile.zlib = isal_zlib
+    try:
+        yield
+    finally:
+        zipfile.zlib = saved
+
+
+def rewrite_docx(zin, out_path, parts):
+    """Write every member of zin to out_path, with parts substituted or added.
+
+    parts maps member names to their new data; names zin doesn't have are
+    appended after the copied members, in the order given.
+    """
+    parts = dict(parts)
+    # Fixtures are regenerated often and size doesn't matter: use the fastest deflate level.
+    with _fast_deflate(), zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zout:
+        for item in zin.infolist():
+            data = parts.pop(item.filename, None)
+            if data is not None:
+                zout.writestr(item, data, compresslevel=1)
+                continue
+            # Untouched parts are streamed across instead of buffered whole; opened
+            # by name so the archive's fast compresslevel applies.
+            with zin.open(item) as src, zout.open(item.filename, "w") as dst:
+                shutil.copyfileobj(src, dst)
+        for name, data in parts.items():
+            zout.writestr(name, data)
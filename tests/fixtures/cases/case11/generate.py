@@ -5,6 +5,7 @@ from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn, nsmap
 from docx.oxml import OxmlElement
+import pathlib
 
 def add_page_number_field(paragraph):
     """Insert PAGE field code into a paragraph."""
@@ -206,5 +207,6 @@ doc.add_paragraph(
     "performance. We look forward to reporting continued progress in our Q4 review."
 )
 
-doc.save("tests/fixtures/case11/input.docx")
-print("Generated tests/fixtures/case11/input.docx")
+out_path = pathlib.Path(__file__).parent / "input.docx"
+doc.save(out_path)
+print(f"Generated {out_path}")
@@ -1,7 +1,15 @@
 """Generate a ~200-page DOCX with headings and body paragraphs for case13."""
 
+import io
+import itertools
+import pathlib
+import zipfile
+from xml.sax.saxutils import escape
+
 from docx import Document
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Pt, Inches
+from lxml import etree
 
 CHAPTERS = [
     "Introduction",
@@ -108,19 +116,61 @@ section.bottom_margin = Inches(1)
 section.left_margin = Inches(1)
 section.right_margin = Inches(1)
 
-para_idx = 0
+W_BODY = qn("w:body")
+
+
+def make_paragraph(text, style=None):
+    """Parse a w:p with a single run, the same XML doc.add_paragraph emits."""
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return etree.fromstring(f"<w:p {nsdecls('w')}>{ppr}<w:r><w:t>{escape(text)}</w:t></w:r></w:p>")
+
+
+# Every distinct paragraph is parsed once up front; xmlfile.write() only
+# serializes, so the same template element can be written any number of times.
+CHAPTER_TEMPLATES = [make_paragraph(chapter, "Heading1") for chapter in CHAPTERS]
+SECTION_TEMPLATES = [make_paragraph(section_title, "Heading2") for section_title in SECTIONS]
+PARA_TEMPLATES = [make_paragraph(text) for text in PARAGRAPHS]
+
+
+def write_body(xf):
+    """Stream every paragraph into xf, one element at a time; returns the body paragraph count."""
+    para_count = 0
+    paragraph_cycle = itertools.cycle(PARA_TEMPLATES)
+    for ch_num, chapter_el in enumerate(CHAPTER_TEMPLATES):
+        xf.write(chapter_el)
+
+        for sec_num, section_el in enumerate(SECTION_TEMPLATES):
+            xf.write(section_el)
+
+            # 16-20 paragraphs per section, cycling through the pool
+            n_paras = 16 + (ch_num + sec_num) % 5
+            for _ in range(n_paras):
+                xf.write(next(paragraph_cycle))
+            para_count += n_paras
+    return para_count
+
 
-for ch_num, chapter in enumerate(CHAPTERS):
-    doc.add_heading(chapter, level=1)
+# python-docx only supplies the package template (styles, theme, settings,
+# page setup). word/document.xml is streamed with etree.xmlfile straight into
+# the output zip, so the ~2000 paragraphs never sit in memory as one tree.
+doc_el = doc.element
+sect_pr = doc_el.body.sectPr
 
-    for sec_num, section_title in enumerate(SECTIONS):
-        doc.add_heading(f"{section_title}", level=2)
+tmp_buf = io.BytesIO()
+doc.save(tmp_buf)
+tmp_buf.seek(0)
 
-        # 16-20 paragraphs per section, cycling through the pool
-        n_paras = 16 + (ch_num + sec_num) % 5
-        for _ in range(n_paras):
-            doc.add_paragraph(PARAGRAPHS[para_idx % len(PARAGRAPHS)])
-            para_idx += 1
+out_path = pathlib.Path(__file__).parent / "input.docx"
+with zipfile.ZipFile(tmp_buf, "r") as zin, zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as zout:
+    for item in zin.infolist():
+        if item.filename != "word/document.xml":
+            zout.writestr(item, zin.read(item.filename))
+            continue
+        with zout.open(item.filename, "w") as f, etree.xmlfile(f, encoding="UTF-8") as xf:
+            xf.write_declaration(standalone=True)
+            with xf.element(doc_el.tag, attrib=dict(doc_el.attrib), nsmap=doc_el.nsmap):
+                with xf.element(W_BODY):
+                    para_count = write_body(xf)
+                    xf.write(sect_pr)
 
-doc.save("tests/fixtures/case13/input.docx")
-print(f"Generated tests/fixtures/case13/input.docx ({para_idx} paragraphs)")
+print(f"Generated {out_path} ({para_count} paragraphs)")
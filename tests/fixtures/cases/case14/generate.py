@@ -2,9 +2,17 @@
 """Generate case14 test fixture: clickable hyperlinks."""
 from docx import Document
 from docx.shared import Pt, RGBColor
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+# w:hyperlink > w:r > (w:rPr/w:rStyle, w:t), parsed in one go per link.
+HYPERLINK_XML = (
+    '<w:hyperlink %s r:id="%%s">'
+    '<w:r><w:rPr><w:rStyle w:val="Hyperlink"/></w:rPr><w:t>%%s</w:t></w:r>'
+    "</w:hyperlink>"
+) % nsdecls("w", "r")
 
 
 def add_hyperlink(paragraph, url, text, font_name="Aptos", font_size=Pt(12)):
@@ -16,24 +24,9 @@ def add_hyperlink(paragraph, url, text, font_name="Aptos", font_size=Pt(12)):
         is_external=True,
     )
 
-    hyperlink = OxmlElement("w:hyperlink")
-    hyperlink.set(qn("r:id"), r_id)
-
-    run = OxmlElement("w:r")
-    rPr = OxmlElement("w:rPr")
-
-    rStyle = OxmlElement("w:rStyle")
-    rStyle.set(qn("w:val"), "Hyperlink")
-    rPr.append(rStyle)
-
-    run.append(rPr)
-
-    t = OxmlElement("w:t")
-    t.text = text
-    run.append(t)
-
-    hyperlink.append(run)
+    hyperlink = parse_xml(HYPERLINK_XML % (r_id, escape(text)))
     paragraph._p.append(hyperlink)
+    run = hyperlink[0]
 
     return run
 
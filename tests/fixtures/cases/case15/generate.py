@@ -4,8 +4,9 @@ from docx import Document
 from docx.shared import Inches, Pt, Cm, RGBColor
 from docx.enum.table import WD_ALIGN_VERTICAL
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import OxmlElement, parse_xml
+import pathlib
 
 doc = Document()
 
@@ -125,33 +126,31 @@ for r, row_data in enumerate(data):
     for c, text in enumerate(row_data):
         t5.cell(r, c).text = text
 
+# Cell border groups are parsed from complete XML templates in one shot
+# rather than assembled element by element.
+HEADER_BORDERS_XML = (
+    "<w:tcBorders %s>"
+    '<w:top w:val="single" w:sz="12" w:color="FF0000" w:space="0"/>'  # 1.5pt (sz is in 1/8 pt)
+    '<w:bottom w:val="single" w:sz="12" w:color="FF0000" w:space="0"/>'
+    '<w:left w:val="single" w:sz="12" w:color="FF0000" w:space="0"/>'
+    '<w:right w:val="single" w:sz="12" w:color="FF0000" w:space="0"/>'
+    "</w:tcBorders>"
+) % nsdecls("w")
+
+FOOTER_BORDERS_XML = (
+    "<w:tcBorders %s>"
+    '<w:bottom w:val="single" w:sz="24" w:color="0000FF" w:space="0"/>'  # 3pt
+    "</w:tcBorders>"
+) % nsdecls("w")
+
 # Apply thick red border to header row cells
 for c in range(3):
-    tc = t5.cell(0, c)._tc
-    tcPr = tc.get_or_add_tcPr()
-    borders = OxmlElement("w:tcBorders")
-    for edge in ["top", "bottom", "left", "right"]:
-        el = OxmlElement(f"w:{edge}")
-        el.set(qn("w:val"), "single")
-        el.set(qn("w:sz"), "12")  # 1.5pt (sz is in 1/8 pt)
-        el.set(qn("w:color"), "FF0000")
-        el.set(qn("w:space"), "0")
-        borders.append(el)
-    tcPr.append(borders)
+    t5.cell(0, c)._tc.get_or_add_tcPr().append(parse_xml(HEADER_BORDERS_XML))
 
 # Apply thick blue bottom border to footer
 for c in range(3):
-    tc = t5.cell(2, c)._tc
-    tcPr = tc.get_or_add_tcPr()
-    borders = OxmlElement("w:tcBorders")
-    bottom = OxmlElement("w:bottom")
-    bottom.set(qn("w:val"), "single")
-    bottom.set(qn("w:sz"), "24")  # 3pt
-    bottom.set(qn("w:color"), "0000FF")
-    bottom.set(qn("w:space"), "0")
-    borders.append(bottom)
-    tcPr.append(borders)
-
-out = "tests/fixtures/case15/input.docx"
+    t5.cell(2, c)._tc.get_or_add_tcPr().append(parse_xml(FOOTER_BORDERS_XML))
+
+out = pathlib.Path(__file__).parent / "input.docx"
 doc.save(out)
 print(f"Saved to {out}")
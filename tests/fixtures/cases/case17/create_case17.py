@@ -1,8 +1,10 @@
 """Create case17: paragraph shading, full borders, and run highlighting."""
 
+import copy
 import zipfile
 import os
 import shutil
+from xml.sax.saxutils import escape
 from lxml import etree
 
 NSMAP = {
@@ -15,66 +17,154 @@ NSMAP = {
 
 W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
 
-def w(tag):
-    return f'{{{W}}}{tag}'
+class _WDict(dict):
+    """Clark-notation names in the w: namespace, formatted once per tag."""
 
-def make_run(text, bold=False, italic=False, highlight=None, color=None, font_size=None, font_name=None):
-    """Create a w:r element with optional formatting."""
-    r = etree.SubElement(etree.Element('dummy'), w('r'))
-    rpr = etree.SubElement(r, w('rPr'))
-    has_props = False
+    def __missing__(self, tag):
+        name = self[tag] = f'{{{W}}}{tag}'
+        return name
+
+
+_W = _WDict()
+for _tag in (
+    'document', 'body', 'p', 'pPr', 'pStyle', 'jc', 'spacing', 'shd', 'pBdr',
+    'top', 'left', 'bottom', 'right', 'r', 'rPr', 'rFonts', 'sz', 'b', 'i',
+    'color', 'highlight', 't', 'sectPr', 'pgSz', 'pgMar', 'docGrid',
+    'styles', 'style', 'name', 'docDefaults', 'rPrDefault', 'pPrDefault',
+    'val', 'ascii', 'hAnsi', 'eastAsia', 'fill', 'space', 'before', 'after',
+    'line', 'lineRule', 'type', 'default', 'styleId', 'w', 'h',
+):
+    _W[_tag]
+
+w = _W.__getitem__
+
+_RPR_CACHE = {}
+
+
+def _build_rpr(bold, italic, highlight, color, font_size, font_name):
+    """Build a detached w:rPr, or None when the run has no formatting."""
+    if not (font_name or font_size or bold or italic or color or highlight):
+        return None
+
+    rpr = etree.Element(w('rPr'))
 
     if font_name:
         rf = etree.SubElement(rpr, w('rFonts'))
         rf.set(w('ascii'), font_name)
         rf.set(w('hAnsi'), font_name)
-        has_props = True
     if font_size:
         sz = etree.SubElement(rpr, w('sz'))
         sz.set(w('val'), str(int(font_size * 2)))  # half-points
-        has_props = True
     if bold:
         etree.SubElement(rpr, w('b'))
-        has_props = True
     if italic:
         etree.SubElement(rpr, w('i'))
-        has_props = True
     if color:
         c = etree.SubElement(rpr, w('color'))
         c.set(w('val'), color)
-        has_props = True
     if highlight:
         h = etree.SubElement(rpr, w('highlight'))
         h.set(w('val'), highlight)
-        has_props = True
 
-    if not has_props:
-        r.remove(rpr)
+    return rpr
+
+
+def make_run(p, text, bold=False, italic=False, highlight=None, color=None, font_size=None, font_name=None):
+    """Append a w:r element with optional formatting to paragraph p.
+
+    Runs with identical formatting share one cached w:rPr template, which is
+    deep-copied into each run.
+    """
+    key = (bold, italic, highlight, color, font_size, font_name)
+    try:
+        rpr = _RPR_CACHE[key]
+    except KeyError:
+        rpr = _RPR_CACHE[key] = _build_rpr(*key)
+
+    r = etree.SubElement(p, w('r'))
+    if rpr is not None:
+        r.append(copy.deepcopy(rpr))
 
     t = etree.SubElement(r, w('t'))
     t.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
     t.text = text
     return r
 
-def make_paragraph(runs=None, style=None, shading=None, borders=None, space_before=None, space_after=None, alignment=None):
-    """Create a w:p element.
+# Bordered paragraphs, callouts and code blocks have a fixed shape, so each is
+# parsed from a single template instead of going through make_paragraph/make_run.
+_BORDERED_TMPL = (
+    '<w:p xmlns:w="%s"><w:pPr><w:spacing w:after="200"/>{pbdr}</w:pPr>'
+    '<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+) % W
+
+_CALLOUT_TMPL = (
+    '<w:p xmlns:w="%s"><w:pPr><w:spacing w:after="200"/>'
+    '<w:shd w:val="clear" w:color="auto" w:fill="{fill}"/>{pbdr}</w:pPr>'
+    '<w:r><w:rPr><w:b/>{label_color}</w:rPr><w:t xml:space="preserve">{label}</w:t></w:r>'
+    '<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+) % W
+
+_CODEBLOCK_TMPL = (
+    '<w:p xmlns:w="%s"><w:pPr><w:spacing w:after="200"/>'
+    '<w:shd w:val="clear" w:color="auto" w:fill="{fill}"/>{pbdr}</w:pPr>'
+    '<w:r><w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/><w:sz w:val="{sz}"/></w:rPr>'
+    '<w:t xml:space="preserve">{code}</w:t></w:r></w:p>'
+) % W
+
+
+def _pbdr_xml(color, sz, space, sides=('top', 'left', 'bottom', 'right')):
+    """w:pBdr markup with identical single-line edges on the given sides."""
+    edges = ''.join(
+        f'<w:{side} w:val="single" w:sz="{sz}" w:space="{space}" w:color="{color}"/>'
+        for side in ('top', 'left', 'bottom', 'right') if side in sides
+    )
+    return f'<w:pBdr>{edges}</w:pBdr>'
+
+
+def make_bordered(body, text, pbdr):
+    """Append a plain paragraph framed by the given w:pBdr markup."""
+    p = etree.fromstring(_BORDERED_TMPL.format(pbdr=pbdr, text=escape(text)))
+    body.append(p)
+    return p
+
+
+def make_callout(body, label, text, fill, label_color=None, pbdr=''):
+    """Append a shaded paragraph that starts with a bold label such as 'Note: '."""
+    label_color = f'<w:color w:val="{label_color}"/>' if label_color else ''
+    p = etree.fromstring(_CALLOUT_TMPL.format(
+        fill=fill, pbdr=pbdr, label_color=label_color, label=escape(label), text=escape(text),
+    ))
+    body.append(p)
+    return p
+
+
+def make_codeblock(body, code, fill, pbdr='', font='Courier New', font_size=10):
+    """Append a shaded monospace paragraph holding code."""
+    p = etree.fromstring(_CODEBLOCK_TMPL.format(
+        fill=fill, pbdr=pbdr, font=font, sz=int(font_size * 2), code=escape(code),
+    ))
+    body.append(p)
+    return p
+
+
+def make_paragraph(body, style=None, shading=None, space_before=None, space_after=None, alignment=None):
+    """Append a w:p element to body. Runs are added afterwards with make_run.
 
     shading: dict with 'fill' (hex color), optional 'val' (e.g. 'clear')
-    borders: dict with sides ('top','bottom','left','right') each having 'val','sz','color','space'
     """
-    p = etree.Element(w('p'))
+    p = etree.SubElement(body, w('p'))
+    if not (style or alignment or space_before is not None or space_after is not None or shading):
+        return p
+
     ppr = etree.SubElement(p, w('pPr'))
-    has_ppr = False
 
     if style:
         ps = etree.SubElement(ppr, w('pStyle'))
         ps.set(w('val'), style)
-        has_ppr = True
 
     if alignment:
         jc = etree.SubElement(ppr, w('jc'))
         jc.set(w('val'), alignment)
-        has_ppr = True
 
     if space_before is not None or space_after is not None:
         spacing = etree.SubElement(ppr, w('spacing'))
@@ -82,33 +172,12 @@ def make_paragraph(runs=None, style=None, shading=None, borders=None, space_befo
             spacing.set(w('before'), str(space_before))
         if space_after is not None:
             spacing.set(w('after'), str(space_after))
-        has_ppr = True
 
     if shading:
         shd = etree.SubElement(ppr, w('shd'))
         shd.set(w('val'), shading.get('val', 'clear'))
         shd.set(w('color'), 'auto')
         shd.set(w('fill'), shading['fill'])
-        has_ppr = True
-
-    if borders:
-        pbdr = etree.SubElement(ppr, w('pBdr'))
-        for side in ['top', 'left', 'bottom', 'right']:
-            if side in borders:
-                b = borders[side]
-                el = etree.SubElement(pbdr, w(side))
-                el.set(w('val'), b.get('val', 'single'))
-                el.set(w('sz'), str(b.get('sz', 4)))
-                el.set(w('space'), str(b.get('space', 1)))
-                el.set(w('color'), b.get('color', 'auto'))
-        has_ppr = True
-
-    if not has_ppr:
-        p.remove(ppr)
-
-    if runs:
-        for r in runs:
-            p.append(r)
 
     return p
 
@@ -117,124 +186,77 @@ def build_document():
     body = etree.Element(w('body'))
 
     # --- Heading ---
-    body.append(make_paragraph(
-        runs=[make_run('Paragraph Shading, Borders & Highlighting', font_size=16, bold=True, color='2E74B5')],
-        style='Heading1',
-        space_after=200,
-    ))
+    p = make_paragraph(body, style='Heading1', space_after=200)
+    make_run(p, 'Paragraph Shading, Borders & Highlighting', font_size=16, bold=True, color='2E74B5')
 
     # --- 1. Paragraph with yellow shading ---
-    body.append(make_paragraph(
-        runs=[
-            make_run('Note: ', bold=True),
-            make_run('This paragraph has a yellow background to simulate a note or callout box. Paragraph shading is controlled by the w:shd element in paragraph properties.'),
-        ],
-        shading={'fill': 'FFFFCC'},
-        space_after=200,
-    ))
+    make_callout(
+        body, 'Note: ',
+        'This paragraph has a yellow background to simulate a note or callout box. Paragraph shading is controlled by the w:shd element in paragraph properties.',
+        fill='FFFFCC',
+    )
 
     # --- 2. Paragraph with all-4-side borders ---
-    border_def = {'val': 'single', 'sz': 4, 'space': 4, 'color': '000000'}
-    body.append(make_paragraph(
-        runs=[make_run('This paragraph has borders on all four sides, creating a box effect. Only bottom borders were previously supported.')],
-        borders={'top': border_def, 'bottom': border_def, 'left': border_def, 'right': border_def},
-        space_after=200,
-    ))
+    make_bordered(
+        body,
+        'This paragraph has borders on all four sides, creating a box effect. Only bottom borders were previously supported.',
+        pbdr=_pbdr_xml('000000', sz=4, space=4),
+    )
 
     # --- 3. Borders + shading combined (callout box) ---
-    body.append(make_paragraph(
-        runs=[
-            make_run('Warning: ', bold=True, color='CC0000'),
-            make_run('This is a warning box with both a light red background and dark red borders. This pattern is common in technical documentation for important notices.'),
-        ],
-        shading={'fill': 'FFEEEE'},
-        borders={
-            'top': {'val': 'single', 'sz': 8, 'space': 4, 'color': 'CC0000'},
-            'bottom': {'val': 'single', 'sz': 8, 'space': 4, 'color': 'CC0000'},
-            'left': {'val': 'single', 'sz': 8, 'space': 4, 'color': 'CC0000'},
-            'right': {'val': 'single', 'sz': 8, 'space': 4, 'color': 'CC0000'},
-        },
-        space_after=200,
-    ))
+    make_callout(
+        body, 'Warning: ',
+        'This is a warning box with both a light red background and dark red borders. This pattern is common in technical documentation for important notices.',
+        fill='FFEEEE', label_color='CC0000', pbdr=_pbdr_xml('CC0000', sz=8, space=4),
+    )
 
     # --- 4. Normal paragraph with highlighted runs ---
-    body.append(make_paragraph(
-        runs=[
-            make_run('This paragraph contains '),
-            make_run('yellow highlighted text', highlight='yellow'),
-            make_run(' and also '),
-            make_run('cyan highlighted text', highlight='cyan'),
-            make_run(' mixed with normal text. Highlighting uses the w:highlight element on individual runs.'),
-        ],
-        space_after=200,
-    ))
+    p = make_paragraph(body, space_after=200)
+    make_run(p, 'This paragraph contains ')
+    make_run(p, 'yellow highlighted text', highlight='yellow')
+    make_run(p, ' and also ')
+    make_run(p, 'cyan highlighted text', highlight='cyan')
+    make_run(p, ' mixed with normal text. Highlighting uses the w:highlight element on individual runs.')
 
     # --- 5. Green info box (left border only, like a blockquote) ---
-    body.append(make_paragraph(
-        runs=[
-            make_run('Tip: ', bold=True, color='2E7D32'),
-            make_run('This uses a thick left border with light green shading, a common pattern for tip or info boxes in documentation.'),
-        ],
-        shading={'fill': 'E8F5E9'},
-        borders={
-            'left': {'val': 'single', 'sz': 24, 'space': 8, 'color': '2E7D32'},
-        },
-        space_after=200,
-    ))
+    make_callout(
+        body, 'Tip: ',
+        'This uses a thick left border with light green shading, a common pattern for tip or info boxes in documentation.',
+        fill='E8F5E9', label_color='2E7D32', pbdr=_pbdr_xml('2E7D32', sz=24, space=8, sides=('left',)),
+    )
 
     # --- 6. Blue info box with all borders ---
-    body.append(make_paragraph(
-        runs=[
-            make_run('Info: ', bold=True, color='1565C0'),
-            make_run('A blue-themed information box. Background shading combined with matching colored borders creates a professional look for callouts.'),
-        ],
-        shading={'fill': 'E3F2FD'},
-        borders={
-            'top': {'val': 'single', 'sz': 6, 'space': 4, 'color': '1565C0'},
-            'bottom': {'val': 'single', 'sz': 6, 'space': 4, 'color': '1565C0'},
-            'left': {'val': 'single', 'sz': 6, 'space': 4, 'color': '1565C0'},
-            'right': {'val': 'single', 'sz': 6, 'space': 4, 'color': '1565C0'},
-        },
-        space_after=200,
-    ))
+    make_callout(
+        body, 'Info: ',
+        'A blue-themed information box. Background shading combined with matching colored borders creates a professional look for callouts.',
+        fill='E3F2FD', label_color='1565C0', pbdr=_pbdr_xml('1565C0', sz=6, space=4),
+    )
 
     # --- 7. Multiple highlight colors ---
-    body.append(make_paragraph(
-        runs=[
-            make_run('Highlighting comes in many colors: '),
-            make_run('yellow', highlight='yellow'),
-            make_run(', '),
-            make_run('green', highlight='green'),
-            make_run(', '),
-            make_run('cyan', highlight='cyan'),
-            make_run(', '),
-            make_run('magenta', highlight='magenta'),
-            make_run(', '),
-            make_run('red', highlight='red'),
-            make_run(', and '),
-            make_run('darkYellow', highlight='darkYellow'),
-            make_run('. Each uses a different w:highlight value.'),
-        ],
-        space_after=200,
-    ))
+    p = make_paragraph(body, space_after=200)
+    make_run(p, 'Highlighting comes in many colors: ')
+    make_run(p, 'yellow', highlight='yellow')
+    make_run(p, ', ')
+    make_run(p, 'green', highlight='green')
+    make_run(p, ', ')
+    make_run(p, 'cyan', highlight='cyan')
+    make_run(p, ', ')
+    make_run(p, 'magenta', highlight='magenta')
+    make_run(p, ', ')
+    make_run(p, 'red', highlight='red')
+    make_run(p, ', and ')
+    make_run(p, 'darkYellow', highlight='darkYellow')
+    make_run(p, '. Each uses a different w:highlight value.')
 
     # --- 8. Gray code block style ---
-    body.append(make_paragraph(
-        runs=[make_run('fn main() {\n    println!("Hello, world!");\n}', font_name='Courier New', font_size=10)],
-        shading={'fill': 'F5F5F5'},
-        borders={
-            'top': {'val': 'single', 'sz': 4, 'space': 4, 'color': 'CCCCCC'},
-            'bottom': {'val': 'single', 'sz': 4, 'space': 4, 'color': 'CCCCCC'},
-            'left': {'val': 'single', 'sz': 4, 'space': 4, 'color': 'CCCCCC'},
-            'right': {'val': 'single', 'sz': 4, 'space': 4, 'color': 'CCCCCC'},
-        },
-        space_after=200,
-    ))
+    make_codeblock(
+        body, 'fn main() {\n    println!("Hello, world!");\n}',
+        fill='F5F5F5', pbdr=_pbdr_xml('CCCCCC', sz=4, space=4),
+    )
 
     # --- 9. Final normal paragraph ---
-    body.append(make_paragraph(
-        runs=[make_run('This final paragraph has no special formatting. It verifies that normal text layout resumes correctly after paragraphs with shading, borders, and highlighting.')],
-    ))
+    p = make_paragraph(body)
+    make_run(p, 'This final paragraph has no special formatting. It verifies that normal text layout resumes correctly after paragraphs with shading, borders, and highlighting.')
 
     # --- Section properties ---
     sect_pr = etree.SubElement(body, w('sectPr'))
@@ -255,71 +277,44 @@ def build_document():
     return body
 
 
-def build_styles():
-    """Minimal styles.xml with Normal and Heading1."""
-    styles = etree.Element(w('styles'))
-
-    # docDefaults
-    doc_defaults = etree.SubElement(styles, w('docDefaults'))
-    rpr_default = etree.SubElement(doc_defaults, w('rPrDefault'))
-    rpr = etree.SubElement(rpr_default, w('rPr'))
-    rf = etree.SubElement(rpr, w('rFonts'))
-    rf.set(w('ascii'), 'Aptos')
-    rf.set(w('hAnsi'), 'Aptos')
-    rf.set(w('eastAsia'), 'Aptos')
-    sz = etree.SubElement(rpr, w('sz'))
-    sz.set(w('val'), '24')  # 12pt
-
-    ppr_default = etree.SubElement(doc_defaults, w('pPrDefault'))
-    ppr = etree.SubElement(ppr_default, w('pPr'))
-    spacing = etree.SubElement(ppr, w('spacing'))
-    spacing.set(w('after'), '160')
-    spacing.set(w('line'), '278')
-    spacing.set(w('lineRule'), 'auto')
-
-    # Normal style
-    normal = etree.SubElement(styles, w('style'))
-    normal.set(w('type'), 'paragraph')
-    normal.set(w('default'), '1')
-    normal.set(w('styleId'), 'Normal')
-    name = etree.SubElement(normal, w('name'))
-    name.set(w('val'), 'Normal')
-
-    # Heading1 style
-    h1 = etree.SubElement(styles, w('style'))
-    h1.set(w('type'), 'paragraph')
-    h1.set(w('styleId'), 'Heading1')
-    name = etree.SubElement(h1, w('name'))
-    name.set(w('val'), 'heading 1')
-    h1_ppr = etree.SubElement(h1, w('pPr'))
-    h1_spacing = etree.SubElement(h1_ppr, w('spacing'))
-    h1_spacing.set(w('before'), '240')
-    h1_rpr = etree.SubElement(h1, w('rPr'))
-    h1_rf = etree.SubElement(h1_rpr, w('rFonts'))
-    h1_rf.set(w('ascii'), 'Aptos')
-    h1_rf.set(w('hAnsi'), 'Aptos')
-    h1_sz = etree.SubElement(h1_rpr, w('sz'))
-    h1_sz.set(w('val'), '32')  # 16pt
-    h1_b = etree.SubElement(h1_rpr, w('b'))
-    h1_color = etree.SubElement(h1_rpr, w('color'))
-    h1_color.set(w('val'), '2E74B5')
-
-    return styles
-
-
-def create_docx(output_path):
-    """Build a DOCX by hand as a ZIP file."""
-    body = build_document()
-    styles_el = build_styles()
-
-    # Wrap body in w:document
-    doc_el = etree.Element(w('document'))
-    doc_el.append(body)
-
-    doc_xml = etree.tostring(doc_el, xml_declaration=True, encoding='UTF-8', standalone=True)
-    styles_xml = etree.tostring(styles_el, xml_declaration=True, encoding='UTF-8', standalone=True)
-
-    content_types = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+# styles.xml has no dynamic inputs, so it is a literal rather than built with
+# lxml: minimal Normal and Heading1 styles over Aptos 12pt docDefaults.
+_STYLES_XML = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:docDefaults>
+    <w:rPrDefault>
+      <w:rPr>
+        <w:rFonts w:ascii="Aptos" w:hAnsi="Aptos" w:eastAsia="Aptos"/>
+        <w:sz w:val="24"/>
+      </w:rPr>
+    </w:rPrDefault>
+    <w:pPrDefault>
+      <w:pPr>
+        <w:spacing w:after="160" w:line="278" w:lineRule="auto"/>
+      </w:pPr>
+    </w:pPrDefault>
+  </w:docDefaults>
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal">
+    <w:name w:val="Normal"/>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Heading1">
+    <w:name w:val="heading 1"/>
+    <w:pPr>
+      <w:spacing w:before="240"/>
+    </w:pPr>
+    <w:rPr>
+      <w:rFonts w:ascii="Aptos" w:hAnsi="Aptos"/>
+      <w:sz w:val="32"/>
+      <w:b/>
+      <w:color w:val="2E74B5"/>
+    </w:rPr>
+  </w:style>
+</w:styles>'''
+
+
+# Package plumbing parts. They are only a few hundred bytes, so they are
+# STORED rather than deflated.
+_CONTENT_TYPES_XML = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
   <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
   <Default Extension="xml" ContentType="application/xml"/>
@@ -327,22 +322,41 @@ def create_docx(output_path):
   <Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
 </Types>'''
 
-    rels = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_RELS_XML = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
 </Relationships>'''
 
-    doc_rels = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_DOC_RELS_XML = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
   <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
 </Relationships>'''
 
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr('[Content_Types].xml', content_types)
-        zf.writestr('_rels/.rels', rels)
-        zf.writestr('word/_rels/document.xml.rels', doc_rels)
-        zf.writestr('word/document.xml', doc_xml)
-        zf.writestr('word/styles.xml', styles_xml)
+
+_XML_ENCODING = 'UTF-8'
+
+
+def _write_xml(f, el):
+    """Serialize a part straight into f (no intermediate bytes, no pretty-printing)."""
+    etree.ElementTree(el).write(f, xml_declaration=True, encoding=_XML_ENCODING, standalone=True, pretty_print=False)
+
+
+def create_docx(output_path):
+    """Build a DOCX by hand as a ZIP file."""
+    body = build_document()
+
+    # Wrap body in w:document
+    doc_el = etree.Element(w('document'))
+    doc_el.append(body)
+
+    # Fast deflate: fixtures are regenerated often and size doesn't matter.
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr('[Content_Types].xml', _CONTENT_TYPES_XML, compress_type=zipfile.ZIP_STORED)
+        zf.writestr('_rels/.rels', _RELS_XML, compress_type=zipfile.ZIP_STORED)
+        zf.writestr('word/_rels/document.xml.rels', _DOC_RELS_XML, compress_type=zipfile.ZIP_STORED)
+        with zf.open('word/document.xml', 'w', force_zip64=False) as f:
+            _write_xml(f, doc_el)
+        zf.writestr('word/styles.xml', _STYLES_XML)
 
     print(f'Created {output_path}')
 
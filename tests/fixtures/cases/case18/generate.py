@@ -11,41 +11,37 @@ Tests:
 """
 
 import zipfile
-import io
 
 WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 REL = "http://schemas.openxmlformats.org/package/2006/relationships"
 CT = "http://schemas.openxmlformats.org/package/2006/content-types"
 DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 
-def make_docx():
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
-        # [Content_Types].xml
-        z.writestr("[Content_Types].xml", f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+# Static parts and the fixed head/tail of the generated ones, formatted and
+# encoded once at import time. Only the paragraph/footnote bodies are
+# assembled per build.
+CONTENT_TYPES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Types xmlns="{CT}">
   <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
   <Default Extension="xml" ContentType="application/xml"/>
   <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
   <Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
   <Override PartName="/word/footnotes.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml"/>
-</Types>""")
+</Types>""".encode()
 
-        # _rels/.rels
-        z.writestr("_rels/.rels", f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+RELS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="{REL}">
   <Relationship Id="rId1" Type="{DOC_REL}/officeDocument" Target="word/document.xml"/>
-</Relationships>""")
+</Relationships>""".encode()
 
-        # word/_rels/document.xml.rels
-        z.writestr("word/_rels/document.xml.rels", f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+DOC_RELS_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="{REL}">
   <Relationship Id="rId1" Type="{DOC_REL}/styles" Target="styles.xml"/>
   <Relationship Id="rId2" Type="{DOC_REL}/footnotes" Target="footnotes.xml"/>
-</Relationships>""")
+</Relationships>""".encode()
 
-        # word/styles.xml — Aptos 12pt defaults + FootnoteReference + FootnoteText styles
-        z.writestr("word/styles.xml", f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+# Aptos 12pt defaults + FootnoteReference + FootnoteText styles
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:styles xmlns:w="{WML}">
   <w:docDefaults>
     <w:rPrDefault><w:rPr>
@@ -70,87 +66,14 @@ def make_docx():
     <w:pPr><w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>
     <w:rPr><w:sz w:val="20"/></w:rPr>
   </w:style>
-</w:styles>""")
-
-        # Helper: footnote reference in body text
-        def fn_ref(fn_id):
-            return f"""<w:r>
-        <w:rPr><w:rStyle w:val="FootnoteReference"/></w:rPr>
-        <w:footnoteReference w:id="{fn_id}"/>
-      </w:r>"""
-
-        # Helper: simple text run
-        def text_run(text, bold=False, italic=False):
-            rpr = ""
-            parts = []
-            if bold:
-                parts.append("<w:b/>")
-            if italic:
-                parts.append("<w:i/>")
-            if parts:
-                rpr = f"<w:rPr>{''.join(parts)}</w:rPr>"
-            return f'<w:r>{rpr}<w:t xml:space="preserve">{text}</w:t></w:r>'
-
-        # Helper: paragraph
-        def para(runs_xml, style=None):
-            ppr = ""
-            if style:
-                ppr = f"<w:pPr><w:pStyle w:val=\"{style}\"/></w:pPr>"
-            return f"<w:p>{ppr}{runs_xml}</w:p>"
-
-        # Build document.xml
-        body_paragraphs = []
-
-        # Title
-        body_paragraphs.append(para(text_run("Footnotes in Documents"), "Heading1"))
-
-        # Para 1: single footnote
-        body_paragraphs.append(para(
-            text_run("Footnotes are a standard feature of academic and professional writing")
-            + fn_ref(2)
-            + text_run(". They provide additional context without interrupting the main text flow.")
-        ))
-
-        # Para 2: two footnotes in same paragraph
-        body_paragraphs.append(para(
-            text_run("The history of footnotes dates back to the invention of the printing press")
-            + fn_ref(3)
-            + text_run(", and they remain essential in modern publishing")
-            + fn_ref(4)
-            + text_run(". Different style guides have varying rules for their usage.")
-        ))
-
-        # Para 3: regular text (no footnotes)
-        body_paragraphs.append(para(
-            text_run("This paragraph has no footnotes. It exists to add body text and verify that normal paragraphs render correctly between paragraphs that contain footnote references.")
-        ))
-
-        # Para 4: footnote with longer reference text
-        body_paragraphs.append(para(
-            text_run("In scientific writing, footnotes serve a different purpose than in humanities")
-            + fn_ref(5)
-            + text_run(". Scientists typically prefer endnotes or inline citations, while historians and literary scholars often use extensive footnotes to discuss sources and provide commentary.")
-        ))
-
-        # Para 5: another footnote
-        body_paragraphs.append(para(
-            text_run("Legal documents frequently use footnotes for case citations and statutory references")
-            + fn_ref(6)
-            + text_run(". The footnote numbering restarts in some styles and continues in others.")
-        ))
-
-        # Para 6: closing paragraph with footnote
-        body_paragraphs.append(para(
-            text_run("This final paragraph tests that footnote rendering works correctly when multiple footnotes accumulate at the bottom of the page")
-            + fn_ref(7)
-            + text_run(".")
-        ))
-
-        doc_body = "\n".join(body_paragraphs)
-        z.writestr("word/document.xml", f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+</w:styles>""".encode()
+
+DOCUMENT_HEAD = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:document xmlns:w="{WML}" xmlns:r="{DOC_REL}">
   <w:body>
-    {doc_body}
+    """.encode()
+
+DOCUMENT_TAIL = b"""
     <w:sectPr>
       <w:pgSz w:w="12240" w:h="15840"/>
       <w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440"/>
@@ -158,29 +81,9 @@ def make_docx():
       <w:footnotePr/>
     </w:sectPr>
   </w:body>
-</w:document>""")
+</w:document>"""
 
-        # word/footnotes.xml
-        def footnote_para(fn_id, text_parts):
-            """text_parts is a list of (text, bold, italic) tuples"""
-            runs = '<w:r><w:rPr><w:rStyle w:val="FootnoteReference"/></w:rPr><w:footnoteRef/></w:r>'
-            runs += f'<w:r><w:t xml:space="preserve"> </w:t></w:r>'
-            for text, bold, italic in text_parts:
-                rpr_parts = ['<w:sz w:val="20"/>']
-                if bold:
-                    rpr_parts.append("<w:b/>")
-                if italic:
-                    rpr_parts.append("<w:i/>")
-                rpr = f"<w:rPr>{''.join(rpr_parts)}</w:rPr>"
-                runs += f'<w:r>{rpr}<w:t xml:space="preserve">{text}</w:t></w:r>'
-            return f"""<w:footnote w:id="{fn_id}">
-      <w:p>
-        <w:pPr><w:pStyle w:val="FootnoteText"/></w:pPr>
-        {runs}
-      </w:p>
-    </w:footnote>"""
-
-        footnotes_xml = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+FOOTNOTES_HEAD = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:footnotes xmlns:w="{WML}">
     <w:footnote w:type="separator" w:id="0">
       <w:p>
@@ -193,22 +96,148 @@ def make_docx():
         <w:pPr><w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>
         <w:r><w:continuationSeparator/></w:r>
       </w:p>
-    </w:footnote>
-    {footnote_para(2, [("This is a simple footnote providing additional context about the statement above.", False, False)])}
-    {footnote_para(3, [("Gutenberg's movable type press, invented around 1440, revolutionized the dissemination of knowledge.", False, False)])}
-    {footnote_para(4, [("See ", False, False), ("The Chicago Manual of Style", False, True), (", 17th edition, for comprehensive footnote formatting guidelines.", False, False)])}
-    {footnote_para(5, [("Notable exceptions include the ", False, False), ("Nature", False, True), (" journal family, which uses a numbered reference system that functions similarly to footnotes.", False, False)])}
-    {footnote_para(6, [("For example, ", False, False), ("Marbury v. Madison", False, True), (", 5 U.S. 137 (1803), established the principle of judicial review.", False, False)])}
-    {footnote_para(7, [("Final footnote. When many footnotes appear on one page, Word allocates space at the bottom and reduces the body text area accordingly.", False, False)])}
-</w:footnotes>"""
+    </w:footnote>""".encode()
+
+FOOTNOTES_TAIL = b"\n</w:footnotes>"
+
+# Footnote reference runs for body text, keyed by footnote id
+FN_REF = {
+    fn_id: b'<w:r><w:rPr><w:rStyle w:val="FootnoteReference"/></w:rPr><w:footnoteReference w:id="%d"/></w:r>' % fn_id
+    for fn_id in range(2, 8)
+}
+
+# Every run and paragraph in this fixture has one of a few fixed shapes, so each
+# shape is a bytes constant or a one-line %-formatting function, and the call
+# sites build the fragment list directly.
+P_OPEN = b"<w:p>"
+P_HEADING1_OPEN = b'<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+P_CLOSE = b"</w:p>"
+
+
+def plain_run(text):
+    return b'<w:r><w:t xml:space="preserve">%b</w:t></w:r>' % (text,)
+
+
+# Footnote bodies: FootnoteText paragraph, footnoteRef mark, a space, then
+# 10pt plain or italic runs.
+def fn_open(fn_id):
+    return (
+        b'\n    <w:footnote w:id="%d"><w:p><w:pPr><w:pStyle w:val="FootnoteText"/></w:pPr>'
+        b'<w:r><w:rPr><w:rStyle w:val="FootnoteReference"/></w:rPr><w:footnoteRef/></w:r>'
+        b'<w:r><w:t xml:space="preserve"> </w:t></w:r>'
+    ) % (fn_id,)
+
+
+FN_CLOSE = b"</w:p></w:footnote>"
+
+
+def fn_run(text):
+    return b'<w:r><w:rPr><w:sz w:val="20"/></w:rPr><w:t xml:space="preserve">%b</w:t></w:r>' % (text,)
+
+
+def fn_italic_run(text):
+    return b'<w:r><w:rPr><w:sz w:val="20"/><w:i/></w:rPr><w:t xml:space="preserve">%b</w:t></w:r>' % (text,)
+
+
+def make_docx(out_path):
+    # Fixtures are regenerated often and size doesn't matter: use the fastest deflate level.
+    with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        z.writestr("_rels/.rels", RELS_XML)
+        z.writestr("word/_rels/document.xml.rels", DOC_RELS_XML)
+        z.writestr("word/styles.xml", STYLES_XML)
+
+        # word/document.xml
+        out = [
+            DOCUMENT_HEAD,
+
+            # Title
+            P_HEADING1_OPEN,
+            plain_run(b"Footnotes in Documents"),
+            P_CLOSE,
+
+            # Para 1: single footnote
+            P_OPEN,
+            plain_run(b"Footnotes are a standard feature of academic and professional writing"),
+            FN_REF[2],
+            plain_run(b". They provide additional context without interrupting the main text flow."),
+            P_CLOSE,
+
+            # Para 2: two footnotes in same paragraph
+            P_OPEN,
+            plain_run(b"The history of footnotes dates back to the invention of the printing press"),
+            FN_REF[3],
+            plain_run(b", and they remain essential in modern publishing"),
+            FN_REF[4],
+            plain_run(b". Different style guides have varying rules for their usage."),
+            P_CLOSE,
+
+            # Para 3: regular text (no footnotes)
+            P_OPEN,
+            plain_run(b"This paragraph has no footnotes. It exists to add body text and verify that normal paragraphs render correctly between paragraphs that contain footnote references."),
+            P_CLOSE,
+
+            # Para 4: footnote with longer reference text
+            P_OPEN,
+            plain_run(b"In scientific writing, footnotes serve a different purpose than in humanities"),
+            FN_REF[5],
+            plain_run(b". Scientists typically prefer endnotes or inline citations, while historians and literary scholars often use extensive footnotes to discuss sources and provide commentary."),
+            P_CLOSE,
+
+            # Para 5: another footnote
+            P_OPEN,
+            plain_run(b"Legal documents frequently use footnotes for case citations and statutory references"),
+            FN_REF[6],
+            plain_run(b". The footnote numbering restarts in some styles and continues in others."),
+            P_CLOSE,
+
+            # Para 6: closing paragraph with footnote
+            P_OPEN,
+            plain_run(b"This final paragraph tests that footnote rendering works correctly when multiple footnotes accumulate at the bottom of the page"),
+            FN_REF[7],
+            plain_run(b"."),
+            P_CLOSE,
+
+            DOCUMENT_TAIL,
+        ]
+        with z.open("word/document.xml", "w") as f:
+            f.writelines(out)
 
-        z.writestr("word/footnotes.xml", footnotes_xml)
-
-    return buf.getvalue()
+        # word/footnotes.xml
+        out = [
+            FOOTNOTES_HEAD,
+            fn_open(2),
+            fn_run(b"This is a simple footnote providing additional context about the statement above."),
+            FN_CLOSE,
+            fn_open(3),
+            fn_run(b"Gutenberg's movable type press, invented around 1440, revolutionized the dissemination of knowledge."),
+            FN_CLOSE,
+            fn_open(4),
+            fn_run(b"See "),
+            fn_italic_run(b"The Chicago Manual of Style"),
+            fn_run(b", 17th edition, for comprehensive footnote formatting guidelines."),
+            FN_CLOSE,
+            fn_open(5),
+            fn_run(b"Notable exceptions include the "),
+            fn_italic_run(b"Nature"),
+            fn_run(b" journal family, which uses a numbered reference system that functions similarly to footnotes."),
+            FN_CLOSE,
+            fn_open(6),
+            fn_run(b"For example, "),
+            fn_italic_run(b"Marbury v. Madison"),
+            fn_run(b", 5 U.S. 137 (1803), established the principle of judicial review."),
+            FN_CLOSE,
+            fn_open(7),
+            fn_run(b"Final footnote. When many footnotes appear on one page, Word allocates space at the bottom and reduces the body text area accordingly."),
+            FN_CLOSE,
+            FOOTNOTES_TAIL,
+        ]
+        with z.open("word/footnotes.xml", "w") as f:
+            f.writelines(out)
 
 
 if __name__ == "__main__":
     import pathlib
     out = pathlib.Path(__file__).parent / "input.docx"
-    out.write_bytes(make_docx())
+    make_docx(out)
     print(f"Wrote {out} ({out.stat().st_size} bytes)")
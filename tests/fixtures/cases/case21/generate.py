@@ -12,11 +12,24 @@ from docx.shared import Inches, Pt, Twips
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from lxml import etree
-import zipfile
 import pathlib
-import io
+import sys
 
-WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from _common import WML, set_document_compat_mode  # noqa: E402
+
+# Compiled once rather than re-parsing the path string on every find() call.
+_NS = {"w": WML}
+_P_COLS = etree.XPath("w:cols", namespaces=_NS)
+_P_MARKER = etree.XPath(".//w:p//w:r/w:t[text()='COLUMN_BREAK_MARKER']", namespaces=_NS)
+
+# Clark names for the edits below, resolved once instead of per call.
+W_COLS = qn("w:cols")
+W_NUM = qn("w:num")
+W_SPACE = qn("w:space")
+W_BR = qn("w:br")
+W_TYPE = qn("w:type")
 
 doc = Document()
 section = doc.sections[0]
@@ -57,47 +70,25 @@ doc.add_paragraph(
     "is correct in the right column."
 )
 
-# Save, then post-process to set columns and inject column break
-tmp_buf = io.BytesIO()
-doc.save(tmp_buf)
-tmp_buf.seek(0)
-
-out_buf = io.BytesIO()
-with zipfile.ZipFile(tmp_buf, "r") as zin, zipfile.ZipFile(out_buf, "w", zipfile.ZIP_DEFLATED) as zout:
-    for item in zin.infolist():
-        data = zin.read(item.filename)
-        if item.filename == "word/document.xml":
-            tree = etree.fromstring(data)
-            nsmap = {"w": WML}
-
-            # Replace w:cols in sectPr
-            body = tree.find("w:body", nsmap)
-            sect_pr = body.find("w:sectPr", nsmap)
-            for old_cols in sect_pr.findall("w:cols", nsmap):
-                sect_pr.remove(old_cols)
-            cols = etree.SubElement(sect_pr, qn("w:cols"))
-            cols.set(qn("w:num"), "2")
-            cols.set(qn("w:space"), "720")  # 0.5 inch gap
-
-            # Find the marker paragraph and replace its text with a column break
-            for p in body.findall(".//w:p", nsmap):
-                for r in p.findall(".//w:r", nsmap):
-                    t = r.find("w:t", nsmap)
-                    if t is not None and t.text == "COLUMN_BREAK_MARKER":
-                        # Remove the text element, add a break
-                        r.remove(t)
-                        br = etree.SubElement(r, qn("w:br"))
-                        br.set(qn("w:type"), "column")
-
-            data = etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
-        elif item.filename == "word/settings.xml":
-            tree = etree.fromstring(data)
-            for compat_setting in tree.iter("{%s}compatSetting" % WML):
-                if compat_setting.get(qn("w:name")) == "compatibilityMode":
-                    compat_setting.set(qn("w:val"), "15")
-            data = etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
-        zout.writestr(item, data)
+# Set columns and inject the column break on python-docx's in-memory trees, so
+# the saved docx needs no post-processing.
+# Replace w:cols in sectPr
+sect_pr = section._sectPr
+for old_cols in _P_COLS(sect_pr):
+    sect_pr.remove(old_cols)
+cols = etree.SubElement(sect_pr, W_COLS)
+cols.set(W_NUM, "2")
+cols.set(W_SPACE, "720")  # 0.5 inch gap
+
+# Find the marker paragraph and replace its text with a column break
+for t in _P_MARKER(doc.element.body):
+    # Remove the text element, add a break
+    r = t.getparent()
+    r.remove(t)
+    etree.SubElement(r, W_BR, {W_TYPE: "column"})
+
+set_document_compat_mode(doc)
 
 out_path = pathlib.Path(__file__).parent / "input.docx"
-out_path.write_bytes(out_buf.getvalue())
+doc.save(out_path)
 print(f"Wrote {out_path} ({out_path.stat().st_size} bytes)")
@@ -12,11 +12,19 @@ from docx.shared import Inches, Pt
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from lxml import etree
-import zipfile
 import pathlib
-import io
+import sys
+
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from _common import add_plain_paragraphs, set_document_compat_mode  # noqa: E402
+
+# Clark names resolved once instead of calling qn() on every element.
+W_COLS = qn("w:cols")
+W_NUM = qn("w:num")
+W_SPACE = qn("w:space")
+W_SEP = qn("w:sep")
 
-WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
 doc = Document()
 section = doc.sections[0]
@@ -103,41 +111,19 @@ paragraphs = [
     "unum secutus est.",
 ]
 
-for text in paragraphs:
-    doc.add_paragraph(text)
-
-# Save, then post-process to set 3 columns with separator
-tmp_buf = io.BytesIO()
-doc.save(tmp_buf)
-tmp_buf.seek(0)
-
-out_buf = io.BytesIO()
-with zipfile.ZipFile(tmp_buf, "r") as zin, zipfile.ZipFile(out_buf, "w", zipfile.ZIP_DEFLATED) as zout:
-    for item in zin.infolist():
-        data = zin.read(item.filename)
-        if item.filename == "word/document.xml":
-            tree = etree.fromstring(data)
-            nsmap = {"w": WML}
-
-            # Replace w:cols in sectPr with 3-column separator config
-            body = tree.find("w:body", nsmap)
-            sect_pr = body.find("w:sectPr", nsmap)
-            for old_cols in sect_pr.findall("w:cols", nsmap):
-                sect_pr.remove(old_cols)
-            cols = etree.SubElement(sect_pr, qn("w:cols"))
-            cols.set(qn("w:num"), "3")
-            cols.set(qn("w:space"), "480")  # ~1/3 inch gap
-            cols.set(qn("w:sep"), "1")      # draw separator lines
-
-            data = etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
-        elif item.filename == "word/settings.xml":
-            tree = etree.fromstring(data)
-            for compat_setting in tree.iter("{%s}compatSetting" % WML):
-                if compat_setting.get(qn("w:name")) == "compatibilityMode":
-                    compat_setting.set(qn("w:val"), "15")
-            data = etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
-        zout.writestr(item, data)
+add_plain_paragraphs(doc.element.body, paragraphs)
+
+# Replace w:cols in sectPr with 3-column separator config
+sect_pr = section._sectPr
+for old_cols in sect_pr.findall(W_COLS):
+    sect_pr.remove(old_cols)
+cols = etree.SubElement(sect_pr, W_COLS)
+cols.set(W_NUM, "3")
+cols.set(W_SPACE, "480")  # ~1/3 inch gap
+cols.set(W_SEP, "1")      # draw separator lines
+
+set_document_compat_mode(doc)
 
 out_path = pathlib.Path(__file__).parent / "input.docx"
-out_path.write_bytes(out_buf.getvalue())
+doc.save(out_path)
 print(f"Wrote {out_path} ({out_path.stat().st_size} bytes)")
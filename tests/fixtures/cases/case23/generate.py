@@ -11,26 +11,40 @@ from docx.shared import Inches, Pt, Twips
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from lxml import etree
-import zipfile
+import copy
+import functools
 import pathlib
-import io
+import sys
 
-WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from _common import set_document_compat_mode  # noqa: E402
 
+# Clark names resolved once instead of calling qn() on every element.
+W_VAL = qn("w:val")
+W_B = qn("w:b")
+W_SPACING = qn("w:spacing")
+W_DSTRIKE = qn("w:dstrike")
 
-def add_spacing_run(paragraph, text, spacing_twips, bold=False, dstrike=False):
-    """Add a run with explicit character spacing."""
-    run = paragraph.add_run(text)
+
+@functools.lru_cache(maxsize=None)
+def spacing_rpr(spacing_twips, bold, dstrike):
+    """Prebuilt w:rPr for one (spacing, bold, dstrike) combination."""
+    rpr = OxmlElement("w:rPr")
     if bold:
-        run.bold = True
-    rpr = run._element.get_or_add_rPr()
+        etree.SubElement(rpr, W_B)
     if spacing_twips != 0:
-        sp = OxmlElement("w:spacing")
-        sp.set(qn("w:val"), str(spacing_twips))
-        rpr.append(sp)
+        etree.SubElement(rpr, W_SPACING, {W_VAL: str(spacing_twips)})
     if dstrike:
-        ds = OxmlElement("w:dstrike")
-        rpr.append(ds)
+        etree.SubElement(rpr, W_DSTRIKE)
+    return rpr
+
+
+def add_spacing_run(paragraph, text, spacing_twips, bold=False, dstrike=False):
+    """Add a run with explicit character spacing."""
+    run = paragraph.add_run(text)
+    # A fresh run holds only w:t, so its rPr goes in front.
+    run._r.insert(0, copy.deepcopy(spacing_rpr(spacing_twips, bold, dstrike)))
     return run
 
 
@@ -93,27 +107,8 @@ add_spacing_run(p, "This part is condensed. ", -20)
 add_spacing_run(p, "Back to expanded. ", 40)
 add_spacing_run(p, "And normal to finish.", 0)
 
-# Save
-tmp_buf = io.BytesIO()
-doc.save(tmp_buf)
-tmp_buf.seek(0)
-
-out_buf = io.BytesIO()
-with zipfile.ZipFile(tmp_buf, "r") as zin, zipfile.ZipFile(
-    out_buf, "w", zipfile.ZIP_DEFLATED
-) as zout:
-    for item in zin.infolist():
-        data = zin.read(item.filename)
-        if item.filename == "word/settings.xml":
-            tree = etree.fromstring(data)
-            for compat_setting in tree.iter("{%s}compatSetting" % WML):
-                if compat_setting.get(qn("w:name")) == "compatibilityMode":
-                    compat_setting.set(qn("w:val"), "15")
-            data = etree.tostring(
-                tree, xml_declaration=True, encoding="UTF-8", standalone=True
-            )
-        zout.writestr(item, data)
+set_document_compat_mode(doc)
 
 out_path = pathlib.Path(__file__).parent / "input.docx"
-out_path.write_bytes(out_buf.getvalue())
+doc.save(out_path)
 print(f"Wrote {out_path} ({out_path.stat().st_size} bytes)")
@@ -11,23 +11,39 @@ from docx.shared import Inches, Pt
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from lxml import etree
-import zipfile
+import copy
+import functools
 import pathlib
-import io
+import sys
 
-WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from _common import add_plain_paragraphs, set_document_compat_mode  # noqa: E402
+
+# Clark names resolved once instead of calling qn() on every element.
+W_P_PR = qn("w:pPr")
+W_KEEP_LINES = qn("w:keepLines")
+W_VAL = qn("w:val")
+W_W = qn("w:w")
+W_B = qn("w:b")
+
+
+@functools.lru_cache(maxsize=None)
+def scaled_rpr(scale_pct, bold):
+    """Prebuilt w:rPr for one (scale, bold) combination."""
+    rpr = OxmlElement("w:rPr")
+    if bold:
+        etree.SubElement(rpr, W_B)
+    if scale_pct != 100:
+        etree.SubElement(rpr, W_W, {W_VAL: f"{scale_pct}%"})
+    return rpr
 
 
 def add_scaled_run(paragraph, text, scale_pct, bold=False):
     """Add a run with explicit text scaling (w:w)."""
     run = paragraph.add_run(text)
-    if bold:
-        run.bold = True
-    rpr = run._element.get_or_add_rPr()
-    if scale_pct != 100:
-        w_elem = OxmlElement("w:w")
-        w_elem.set(qn("w:val"), f"{scale_pct}%")
-        rpr.append(w_elem)
+    # A fresh run holds only w:t, so its rPr goes in front.
+    run._r.insert(0, copy.deepcopy(scaled_rpr(scale_pct, bold)))
     return run
 
 
@@ -78,11 +94,11 @@ add_scaled_run(p, "Back to wide.", 200)
 doc.add_heading("Keep Lines Test", level=2)
 
 # Add enough filler to push to near page break
-for i in range(30):
-    doc.add_paragraph(
-        f"Filler paragraph {i+1} to push content toward the page break. "
-        "This text occupies space so the keepLines paragraph is near the bottom."
-    )
+add_plain_paragraphs(doc.element.body, (
+    f"Filler paragraph {i+1} to push content toward the page break. "
+    "This text occupies space so the keepLines paragraph is near the bottom."
+    for i in range(30)
+))
 
 # This paragraph should NOT be split across pages
 p = doc.add_paragraph(
@@ -93,42 +109,16 @@ p = doc.add_paragraph(
     "that the keepLines property has an observable effect on the output."
 )
 
-# Save
-tmp_buf = io.BytesIO()
-doc.save(tmp_buf)
-tmp_buf.seek(0)
-
-out_buf = io.BytesIO()
-with zipfile.ZipFile(tmp_buf, "r") as zin, zipfile.ZipFile(
-    out_buf, "w", zipfile.ZIP_DEFLATED
-) as zout:
-    for item in zin.infolist():
-        data = zin.read(item.filename)
-        if item.filename == "word/document.xml":
-            tree = etree.fromstring(data)
-            nsmap = {"w": WML}
-            # Find the last paragraph and add keepLines to its pPr
-            body = tree.find("w:body", nsmap)
-            paragraphs = body.findall("w:p", nsmap)
-            last_p = paragraphs[-1]
-            ppr = last_p.find("w:pPr", nsmap)
-            if ppr is None:
-                ppr = etree.SubElement(last_p, qn("w:pPr"))
-                last_p.insert(0, ppr)
-            keep_lines = etree.SubElement(ppr, qn("w:keepLines"))
-            data = etree.tostring(
-                tree, xml_declaration=True, encoding="UTF-8", standalone=True
-            )
-        elif item.filename == "word/settings.xml":
-            tree = etree.fromstring(data)
-            for compat_setting in tree.iter("{%s}compatSetting" % WML):
-                if compat_setting.get(qn("w:name")) == "compatibilityMode":
-                    compat_setting.set(qn("w:val"), "15")
-            data = etree.tostring(
-                tree, xml_declaration=True, encoding="UTF-8", standalone=True
-            )
-        zout.writestr(item, data)
+# Add keepLines to the paragraph just added; no need to search the body for it
+last_p = p._p
+ppr = last_p.find(W_P_PR)
+if ppr is None:
+    ppr = etree.SubElement(last_p, W_P_PR)
+    last_p.insert(0, ppr)
+keep_lines = etree.SubElement(ppr, W_KEEP_LINES)
+
+set_document_compat_mode(doc)
 
 out_path = pathlib.Path(__file__).parent / "input.docx"
-out_path.write_bytes(out_buf.getvalue())
+doc.save(out_path)
 print(f"Wrote {out_path} ({out_path.stat().st_size} bytes)")
@@ -10,15 +10,14 @@ Each as a separate section with sample text to verify layout.
 
 from docx import Document
 from docx.shared import Inches, Pt, Mm, Twips, Emu
-from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from docx.enum.section import WD_ORIENT
-from lxml import etree
-import zipfile
 import pathlib
-import io
+import sys
 
-WML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+from _common import set_document_compat_mode  # noqa: E402
 
 
 def add_section(doc, width, height, orient, margin=Inches(1)):
@@ -101,27 +100,8 @@ doc.add_paragraph(
     "quickly. Sphinx of black quartz, judge my vow."
 )
 
-# Save with compat mode 15
-tmp_buf = io.BytesIO()
-doc.save(tmp_buf)
-tmp_buf.seek(0)
-
-out_buf = io.BytesIO()
-with zipfile.ZipFile(tmp_buf, "r") as zin, zipfile.ZipFile(
-    out_buf, "w", zipfile.ZIP_DEFLATED
-) as zout:
-    for item in zin.infolist():
-        data = zin.read(item.filename)
-        if item.filename == "word/settings.xml":
-            tree = etree.fromstring(data)
-            for compat_setting in tree.iter("{%s}compatSetting" % WML):
-                if compat_setting.get(qn("w:name")) == "compatibilityMode":
-                    compat_setting.set(qn("w:val"), "15")
-            data = etree.tostring(
-                tree, xml_declaration=True, encoding="UTF-8", standalone=True
-            )
-        zout.writestr(item, data)
+set_document_compat_mode(doc)
 
 out_path = pathlib.Path(__file__).parent / "input.docx"
-out_path.write_bytes(out_buf.getvalue())
+doc.save(out_path)
 print(f"Wrote {out_path} ({out_path.stat().st_size} bytes)")
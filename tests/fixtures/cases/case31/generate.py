@@ -9,6 +9,7 @@ Chart variations:
 
 import os
 import re
+import sys
 import tempfile
 import zipfile
 from pathlib import Path
@@ -16,6 +17,10 @@ from pathlib import Path
 from docx import Document
 from docx.shared import Pt, Inches
 
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from _common import rewrite_docx  # noqa: E402
+
 OUT = Path("tests/fixtures/cases/case31/input.docx")
 
 CHART_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
@@ -398,69 +403,65 @@ chart_sizes = {
 }
 
 with zipfile.ZipFile(tmp, "r") as zin:
-    with zipfile.ZipFile(str(OUT), "w", zipfile.ZIP_DEFLATED) as zout:
-        rels_xml = zin.read("word/_rels/document.xml.rels").decode()
-        ct_xml = zin.read("[Content_Types].xml").decode()
-
-        existing_rids = [int(x) for x in re.findall(r'Id="rId(\d+)"', rels_xml)]
-        next_rid = max(existing_rids, default=0) + 1
-
-        chart_rids = {}
-        for chart_num in sorted(charts.keys()):
-            rid = f"rId{next_rid}"
-            chart_rids[chart_num] = rid
-            next_rid += 1
-
-        new_rels = ""
-        for chart_num, rid in chart_rids.items():
-            new_rels += (
-                f'<Relationship Id="{rid}" '
-                f'Type="{CHART_REL_TYPE}" '
-                f'Target="charts/chart{chart_num}.xml"/>'
-            )
-        rels_xml = rels_xml.replace("</Relationships>", new_rels + "</Relationships>")
-
-        new_ct = ""
-        for chart_num in charts:
-            new_ct += (
-                f'<Override PartName="/word/charts/chart{chart_num}.xml" '
-                f'ContentType="{CT_CHART}"/>'
-            )
-        ct_xml = ct_xml.replace("</Types>", new_ct + "</Types>")
-
-        doc_xml = zin.read("word/document.xml").decode()
-        for chart_num, rid in chart_rids.items():
-            placeholder = f"CHART_PLACEHOLDER_{chart_num}"
-            cx, cy = chart_sizes[chart_num]
-            drawing = build_drawing_xml(rid, cx, cy)
-            run_pattern = f'<w:r><w:rPr></w:rPr><w:t>{placeholder}</w:t></w:r>'
-            run_replacement = f'<w:r>{drawing}</w:r>'
-            if run_pattern in doc_xml:
-                doc_xml = doc_xml.replace(run_pattern, run_replacement)
-            else:
-                run_pattern2 = f'<w:r><w:t>{placeholder}</w:t></w:r>'
-                if run_pattern2 in doc_xml:
-                    doc_xml = doc_xml.replace(run_pattern2, run_replacement)
-                else:
-                    doc_xml = re.sub(
-                        rf'<w:r[^>]*>.*?<w:t[^>]*>{placeholder}</w:t>.*?</w:r>',
-                        run_replacement,
-                        doc_xml,
-                        flags=re.DOTALL,
-                    )
-
-        for item in zin.infolist():
-            if item.filename == "word/_rels/document.xml.rels":
-                zout.writestr(item, rels_xml)
-            elif item.filename == "[Content_Types].xml":
-                zout.writestr(item, ct_xml)
-            elif item.filename == "word/document.xml":
-                zout.writestr(item, doc_xml)
+    rels_xml = zin.read("word/_rels/document.xml.rels").decode()
+    ct_xml = zin.read("[Content_Types].xml").decode()
+
+    existing_rids = [int(x) for x in re.findall(r'Id="rId(\d+)"', rels_xml)]
+    next_rid = max(existing_rids, default=0) + 1
+
+    chart_rids = {}
+    for chart_num in sorted(charts.keys()):
+        rid = f"rId{next_rid}"
+        chart_rids[chart_num] = rid
+        next_rid += 1
+
+    new_rels = ""
+    for chart_num, rid in chart_rids.items():
+        new_rels += (
+            f'<Relationship Id="{rid}" '
+            f'Type="{CHART_REL_TYPE}" '
+            f'Target="charts/chart{chart_num}.xml"/>'
+        )
+    rels_xml = rels_xml.replace("</Relationships>", new_rels + "</Relationships>")
+
+    new_ct = ""
+    for chart_num in charts:
+        new_ct += (
+            f'<Override PartName="/word/charts/chart{chart_num}.xml" '
+            f'ContentType="{CT_CHART}"/>'
+        )
+    ct_xml = ct_xml.replace("</Types>", new_ct + "</Types>")
+
+    doc_xml = zin.read("word/document.xml").decode()
+    for chart_num, rid in chart_rids.items():
+        placeholder = f"CHART_PLACEHOLDER_{chart_num}"
+        cx, cy = chart_sizes[chart_num]
+        drawing = build_drawing_xml(rid, cx, cy)
+        run_pattern = f'<w:r><w:rPr></w:rPr><w:t>{placeholder}</w:t></w:r>'
+        run_replacement = f'<w:r>{drawing}</w:r>'
+        if run_pattern in doc_xml:
+            doc_xml = doc_xml.replace(run_pattern, run_replacement)
+        else:
+            run_pattern2 = f'<w:r><w:t>{placeholder}</w:t></w:r>'
+            if run_pattern2 in doc_xml:
+                doc_xml = doc_xml.replace(run_pattern2, run_replacement)
             else:
-                zout.writestr(item, zin.read(item.filename))
-
-        for chart_num, chart_xml in charts.items():
-            zout.writestr(f"word/charts/chart{chart_num}.xml", chart_xml)
+                doc_xml = re.sub(
+                    rf'<w:r[^>]*>.*?<w:t[^>]*>{placeholder}</w:t>.*?</w:r>',
+                    run_replacement,
+                    doc_xml,
+                    flags=re.DOTALL,
+                )
+
+    parts = {
+        "word/_rels/document.xml.rels": rels_xml,
+        "[Content_Types].xml": ct_xml,
+        "word/document.xml": doc_xml,
+    }
+
+    for chart_num, chart_xml in charts.items():
+        parts[f"word/charts/chart{chart_num}.xml"] = chart_xml
+    rewrite_docx(zin, OUT, parts)
 
 os.unlink(tmp)
 print(f"Generated {OUT}")
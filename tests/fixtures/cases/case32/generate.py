@@ -8,6 +8,7 @@ Tests:
 
 import os
 import re
+import sys
 import tempfile
 import zipfile
 from pathlib import Path
@@ -15,6 +16,10 @@ from pathlib import Path
 from docx import Document
 from docx.shared import Pt, Inches
 
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from _common import rewrite_docx  # noqa: E402
+
 OUT = Path("tests/fixtures/cases/case32/input.docx")
 
 W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
@@ -77,32 +82,27 @@ TBL_BORDERS = (
 )
 
 with zipfile.ZipFile(tmp, "r") as zin:
-    with zipfile.ZipFile(str(OUT), "w", zipfile.ZIP_DEFLATED) as zout:
-        doc_xml = zin.read("word/document.xml").decode()
-
-        # Inject tblpPr and tblBorders into tblPr.
-        # python-docx generates <w:tblPr> with style and width — insert after the opening tag.
-        # Find the first <w:tblPr> and inject our properties right after the existing children.
-        # We'll insert before </w:tblPr>.
-        doc_xml = doc_xml.replace(
-            "</w:tblPr>",
-            TBL_P_PR + TBL_BORDERS + "</w:tblPr>",
-            1,  # only first table
-        )
-
-        # Also remove the tblStyle reference so borders come only from inline tblBorders
-        doc_xml = re.sub(
-            r'<w:tblStyle w:val="[^"]*"/>',
-            "",
-            doc_xml,
-            count=1,
-        )
-
-        for item in zin.infolist():
-            if item.filename == "word/document.xml":
-                zout.writestr(item, doc_xml)
-            else:
-                zout.writestr(item, zin.read(item.filename))
+    doc_xml = zin.read("word/document.xml").decode()
+
+    # Inject tblpPr and tblBorders into tblPr.
+    # python-docx generates <w:tblPr> with style and width — insert after the opening tag.
+    # Find the first <w:tblPr> and inject our properties right after the existing children.
+    # We'll insert before </w:tblPr>.
+    doc_xml = doc_xml.replace(
+        "</w:tblPr>",
+        TBL_P_PR + TBL_BORDERS + "</w:tblPr>",
+        1,  # only first table
+    )
+
+    # Also remove the tblStyle reference so borders come only from inline tblBorders
+    doc_xml = re.sub(
+        r'<w:tblStyle w:val="[^"]*"/>',
+        "",
+        doc_xml,
+        count=1,
+    )
+
+    rewrite_docx(zin, OUT, {"word/document.xml": doc_xml})
 
 os.unlink(tmp)
 print(f"Generated {OUT}")
@@ -9,6 +9,7 @@ Each shape is a floating wps:wsp anchor with a:custGeom instead of a:prstGeom.
 import math
 import os
 import re
+import sys
 import tempfile
 import zipfile
 from pathlib import Path
@@ -16,6 +17,10 @@ from pathlib import Path
 from docx import Document
 from docx.shared import Inches
 
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from _common import rewrite_docx  # noqa: E402
+
 OUT = Path("tests/fixtures/cases/case36/input.docx")
 
 # XML namespaces
@@ -345,37 +350,32 @@ all_shapes_xml = "".join(
 )
 
 with zipfile.ZipFile(tmp, "r") as zin:
-    with zipfile.ZipFile(str(OUT), "w", zipfile.ZIP_DEFLATED) as zout:
-        doc_xml = zin.read("word/document.xml").decode()
-
-        ns_decls = (
-            f' xmlns:wp="{WP_NS}"'
-            f' xmlns:a="{A_NS}"'
-            f' xmlns:wps="{WPS_NS}"'
-            f' xmlns:r="{R_NS}"'
-            f' xmlns:mc="{MC_NS}"'
-        )
-        if 'xmlns:wp=' not in doc_xml:
-            doc_xml = doc_xml.replace(
-                '<w:document ',
-                f'<w:document {ns_decls} ',
-                1,
-            )
-
-        placeholder_pattern = r'<w:r>.*?<w:t>SHAPE_PLACEHOLDER</w:t>\s*</w:r>'
-        doc_xml = re.sub(
-            placeholder_pattern,
-            all_shapes_xml,
-            doc_xml,
-            count=1,
-            flags=re.DOTALL,
+    doc_xml = zin.read("word/document.xml").decode()
+
+    ns_decls = (
+        f' xmlns:wp="{WP_NS}"'
+        f' xmlns:a="{A_NS}"'
+        f' xmlns:wps="{WPS_NS}"'
+        f' xmlns:r="{R_NS}"'
+        f' xmlns:mc="{MC_NS}"'
+    )
+    if 'xmlns:wp=' not in doc_xml:
+        doc_xml = doc_xml.replace(
+            '<w:document ',
+            f'<w:document {ns_decls} ',
+            1,
         )
 
-        for item in zin.infolist():
-            if item.filename == "word/document.xml":
-                zout.writestr(item, doc_xml)
-            else:
-                zout.writestr(item, zin.read(item.filename))
+    placeholder_pattern = r'<w:r>.*?<w:t>SHAPE_PLACEHOLDER</w:t>\s*</w:r>'
+    doc_xml = re.sub(
+        placeholder_pattern,
+        all_shapes_xml,
+        doc_xml,
+        count=1,
+        flags=re.DOTALL,
+    )
+
+    rewrite_docx(zin, OUT, {"word/document.xml": doc_xml})
 
 os.unlink(tmp)
 print(f"Generated {OUT}")
@@ -12,6 +12,7 @@ Layout: 2-row process diagram
 
 import os
 import re
+import sys
 import tempfile
 import zipfile
 from pathlib import Path
@@ -19,6 +20,10 @@ from pathlib import Path
 from docx import Document
 from docx.shared import Inches
 
+# Generators run as plain scripts, so put tests/fixtures on the path for _common.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from _common import rewrite_docx  # noqa: E402
+
 OUT = Path("tests/fixtures/cases/case37/input.docx")
 
 # XML namespaces
@@ -284,93 +289,87 @@ drawing_xml = build_drawing_xml()
 inline_xml = build_inline_drawing_xml()
 
 with zipfile.ZipFile(tmp, "r") as zin:
-    with zipfile.ZipFile(str(OUT), "w", zipfile.ZIP_DEFLATED) as zout:
-        doc_xml = zin.read("word/document.xml").decode()
-        rels_xml = zin.read("word/_rels/document.xml.rels").decode()
-        content_types_xml = zin.read("[Content_Types].xml").decode()
-
-        # Add namespace declarations to document.xml
-        ns_decls = (
-            f' xmlns:wp="{WP_NS}"'
-            f' xmlns:a="{A_NS}"'
-            f' xmlns:r="{R_NS}"'
-            f' xmlns:mc="{MC_NS}"'
-        )
-        if 'xmlns:wp=' not in doc_xml:
-            doc_xml = doc_xml.replace(
-                '<w:document ',
-                f'<w:document {ns_decls} ',
-                1,
-            )
-
-        # Replace placeholder with inline diagram drawing
-        placeholder_pattern = r'<w:r>.*?<w:t>SMARTART_PLACEHOLDER</w:t>\s*</w:r>'
-        doc_xml = re.sub(
-            placeholder_pattern,
-            inline_xml,
-            doc_xml,
-            count=1,
-            flags=re.DOTALL,
+    doc_xml = zin.read("word/document.xml").decode()
+    rels_xml = zin.read("word/_rels/document.xml.rels").decode()
+    content_types_xml = zin.read("[Content_Types].xml").decode()
+
+    # Add namespace declarations to document.xml
+    ns_decls = (
+        f' xmlns:wp="{WP_NS}"'
+        f' xmlns:a="{A_NS}"'
+        f' xmlns:r="{R_NS}"'
+        f' xmlns:mc="{MC_NS}"'
+    )
+    if 'xmlns:wp=' not in doc_xml:
+        doc_xml = doc_xml.replace(
+            '<w:document ',
+            f'<w:document {ns_decls} ',
+            1,
         )
 
-        # Add all diagram relationships to document.xml.rels
-        diagram_rels = (
-            f'<Relationship Id="rIdDiagram1"'
-            f' Type="{REL_TYPE_DIAGRAM_DRAWING}"'
-            f' Target="diagrams/drawing1.xml"/>'
-            f'<Relationship Id="rIdDgmData"'
-            f' Type="{REL_TYPE_DIAGRAM_DATA}"'
-            f' Target="diagrams/data1.xml"/>'
-            f'<Relationship Id="rIdDgmLayout"'
-            f' Type="{REL_TYPE_DIAGRAM_LAYOUT}"'
-            f' Target="diagrams/layout1.xml"/>'
-            f'<Relationship Id="rIdDgmStyle"'
-            f' Type="{REL_TYPE_DIAGRAM_STYLE}"'
-            f' Target="diagrams/style1.xml"/>'
-            f'<Relationship Id="rIdDgmColors"'
-            f' Type="{REL_TYPE_DIAGRAM_COLORS}"'
-            f' Target="diagrams/colors1.xml"/>'
-        )
-        rels_xml = rels_xml.replace(
-            '</Relationships>',
-            f'{diagram_rels}</Relationships>',
-        )
+    # Replace placeholder with inline diagram drawing
+    placeholder_pattern = r'<w:r>.*?<w:t>SMARTART_PLACEHOLDER</w:t>\s*</w:r>'
+    doc_xml = re.sub(
+        placeholder_pattern,
+        inline_xml,
+        doc_xml,
+        count=1,
+        flags=re.DOTALL,
+    )
 
-        # Add content types for all diagram parts
-        diagram_cts = (
-            '<Override PartName="/word/diagrams/drawing1.xml"'
-            ' ContentType="application/vnd.ms-office.drawingml.diagramDrawing+xml"/>'
-            '<Override PartName="/word/diagrams/data1.xml"'
-            ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramData+xml"/>'
-            '<Override PartName="/word/diagrams/layout1.xml"'
-            ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramLayout+xml"/>'
-            '<Override PartName="/word/diagrams/style1.xml"'
-            ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramStyle+xml"/>'
-            '<Override PartName="/word/diagrams/colors1.xml"'
-            ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramColors+xml"/>'
-        )
-        content_types_xml = content_types_xml.replace(
-            '</Types>',
-            f'{diagram_cts}</Types>',
-        )
+    # Add all diagram relationships to document.xml.rels
+    diagram_rels = (
+        f'<Relationship Id="rIdDiagram1"'
+        f' Type="{REL_TYPE_DIAGRAM_DRAWING}"'
+        f' Target="diagrams/drawing1.xml"/>'
+        f'<Relationship Id="rIdDgmData"'
+        f' Type="{REL_TYPE_DIAGRAM_DATA}"'
+        f' Target="diagrams/data1.xml"/>'
+        f'<Relationship Id="rIdDgmLayout"'
+        f' Type="{REL_TYPE_DIAGRAM_LAYOUT}"'
+        f' Target="diagrams/layout1.xml"/>'
+        f'<Relationship Id="rIdDgmStyle"'
+        f' Type="{REL_TYPE_DIAGRAM_STYLE}"'
+        f' Target="diagrams/style1.xml"/>'
+        f'<Relationship Id="rIdDgmColors"'
+        f' Type="{REL_TYPE_DIAGRAM_COLORS}"'
+        f' Target="diagrams/colors1.xml"/>'
+    )
+    rels_xml = rels_xml.replace(
+        '</Relationships>',
+        f'{diagram_rels}</Relationships>',
+    )
 
-        # Write all entries
-        for item in zin.infolist():
-            if item.filename == "word/document.xml":
-                zout.writestr(item, doc_xml)
-            elif item.filename == "word/_rels/document.xml.rels":
-                zout.writestr(item, rels_xml)
-            elif item.filename == "[Content_Types].xml":
-                zout.writestr(item, content_types_xml)
-            else:
-                zout.writestr(item, zin.read(item.filename))
+    # Add content types for all diagram parts
+    diagram_cts = (
+        '<Override PartName="/word/diagrams/drawing1.xml"'
+        ' ContentType="application/vnd.ms-office.drawingml.diagramDrawing+xml"/>'
+        '<Override PartName="/word/diagrams/data1.xml"'
+        ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramData+xml"/>'
+        '<Override PartName="/word/diagrams/layout1.xml"'
+        ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramLayout+xml"/>'
+        '<Override PartName="/word/diagrams/style1.xml"'
+        ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramStyle+xml"/>'
+        '<Override PartName="/word/diagrams/colors1.xml"'
+        ' ContentType="application/vnd.openxmlformats-officedocument.drawingml.diagramColors+xml"/>'
+    )
+    content_types_xml = content_types_xml.replace(
+        '</Types>',
+        f'{diagram_cts}</Types>',
+    )
 
+    parts = {
+        "word/document.xml": doc_xml,
+        "word/_rels/document.xml.rels": rels_xml,
+        "[Content_Types].xml": content_types_xml,
         # Add all diagram part files
-        zout.writestr("word/diagrams/drawing1.xml", drawing_xml)
-        zout.writestr("word/diagrams/data1.xml", build_diagram_data_xml())
-        zout.writestr("word/diagrams/layout1.xml", build_diagram_layout_xml())
-        zout.writestr("word/diagrams/style1.xml", build_diagram_style_xml())
-        zout.writestr("word/diagrams/colors1.xml", build_diagram_colors_xml())
+        "word/diagrams/drawing1.xml": drawing_xml,
+        "word/diagrams/data1.xml": build_diagram_data_xml(),
+        "word/diagrams/layout1.xml": build_diagram_layout_xml(),
+        "word/diagrams/style1.xml": build_diagram_style_xml(),
+        "word/diagrams/colors1.xml": build_diagram_colors_xml(),
+    }
+    rewrite_docx(zin, OUT, parts)
 
 os.unlink(tmp)
 print(f"Generated {OUT}")
@@ -5,10 +5,9 @@
 
 import argparse
 import logging
+import os
 import shutil
 import subprocess
-import threading
-import time
 import uuid
 from pathlib import Path
 
@@ -20,47 +19,91 @@ SCRAPED_DIR = PROJECT_ROOT / "tests" / "fixtures" / "scraped"
 DEFAULT_DOWNLOAD_DIR = PROJECT_ROOT / "downloads"
 
 
-DISMISS_SCRIPT = """
-    tell application "System Events"
-        tell process "Microsoft Word"
-            if exists (button "Yes" of window 1) then
-                click button "Yes" of window 1
-            else if exists (button "OK" of window 1) then
-                click button "OK" of window 1
-            end if
-        end tell
-    end tell
+# Runs for the whole batch in a single osascript process, checking for and
+# dismissing Word dialogs every 0.5 s, instead of forking osascript per check.
+WATCH_SCRIPT = """
+    repeat
+        try
+            tell application "System Events"
+                tell process "Microsoft Word"
+                    if exists (button "Yes" of window 1) then
+                        click button "Yes" of window 1
+                    else if exists (button "OK" of window 1) then
+                        click button "OK" of window 1
+                    end if
+                end tell
+            end tell
+        end try
+        delay 0.5
+    end repeat
 """
 
 
-def dialog_watcher(stop_event: threading.Event) -> None:
-    while not stop_event.is_set():
-        subprocess.run(["osascript", "-e", DISMISS_SCRIPT], capture_output=True)
-        time.sleep(0.5)
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, falling back to a copy across filesystems."""
+    # Replace rather than write through an existing dst, which may itself be a link.
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def start_dialog_watcher() -> subprocess.Popen:
+    return subprocess.Popen(["osascript", "-e", WATCH_SCRIPT], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
 
+def convert_to_pdf(pairs: list[tuple[Path, Path]]) -> None:
+    """Convert every (docx, pdf) pair in one Word session.
 
-def convert_to_pdf(tmp_docx: Path, tmp_pdf: Path) -> None:
+    A file that fails is closed, reported as a warning and skipped; callers
+    check which PDFs exist afterwards.
+    """
+    items = ", ".join(f'{{"{docx}", "{pdf}", "{docx.name}"}}' for docx, pdf in pairs)
     script = f"""
         tell application "Microsoft Word"
             set display alerts to -2
-            open POSIX file "{tmp_docx}"
-            delay 2
-            set theDoc to document 1
-            save as theDoc file name "{tmp_pdf}" file format format PDF
-            close theDoc saving no
+            repeat with pair in {{{items}}}
+                set {{docPath, pdfPath, docName}} to contents of pair
+                try
+                    -- Wait for this file's document to appear (up to 5 s) rather than a
+                    -- fixed delay; one left open by an earlier failure mustn't satisfy it.
+                    set openBefore to count of documents
+                    open POSIX file docPath
+                    repeat 50 times
+                        if (count of documents) > openBefore then exit repeat
+                        delay 0.1
+                    end repeat
+                    if (count of documents) <= openBefore then error "document did not open"
+                    -- Staged names are unique within the batch, so this is the file just opened.
+                    set theDoc to first document whose name is docName
+                    save as theDoc file name pdfPath file format format PDF
+                    close theDoc saving no
+                on error errMsg
+                    -- Don't leave a half-opened document behind for the rest of the batch.
+                    try
+                        close (every document whose name is docName) saving no
+                    end try
+                    log "FAIL " & docPath & ": " & errMsg
+                end try
+            end repeat
             set display alerts to 0
         end tell
     """
-    stop_event = threading.Event()
-    watcher = threading.Thread(target=dialog_watcher, args=(stop_event,), daemon=True)
-    watcher.start()
-
-    log.debug("Running osascript for %s", tmp_docx.name)
-    result = subprocess.run(["osascript", "-e", script], capture_output=True, text=True)
-
-    stop_event.set()
-    if result.stderr:
-        log.debug("osascript stderr: %s", result.stderr.strip())
+    watcher = start_dialog_watcher()
+    try:
+        log.debug("Running osascript for %d files", len(pairs))
+        result = subprocess.run(["osascript", "-e", script], capture_output=True, text=True)
+    finally:
+        watcher.terminate()
+        watcher.wait()
+
+    # AppleScript's log writes to stderr; per-file failures are surfaced as warnings.
+    for line in result.stderr.splitlines():
+        if line.startswith("FAIL "):
+            log.warning("%s", line)
+        elif line.strip():
+            log.debug("osascript stderr: %s", line)
     if result.returncode != 0:
         raise RuntimeError(result.stderr.strip())
 
@@ -82,32 +125,42 @@ def main() -> None:
     docx_files = list(input_dir.glob("*.docx"))
     log.info("Found %d files to convert", len(docx_files))
 
+    staged = []
+    error = None
     try:
         for docx_file in docx_files:
-            h = docx_file.stem
-            log.info("Processing %s", h)
-
-            doc_dir = SCRAPED_DIR / h
-            doc_dir.mkdir(exist_ok=True)
-            shutil.copy2(docx_file, doc_dir / "input.docx")
-
+            log.info("Staging %s", docx_file.stem)
             tmp_docx = staging / docx_file.name
             tmp_pdf = staging / docx_file.with_suffix(".pdf").name
-            shutil.copy2(docx_file, tmp_docx)
+            link_or_copy(docx_file, tmp_docx)
             subprocess.run(["xattr", "-d", "com.apple.quarantine", str(tmp_docx)], capture_output=True)
+            staged.append((docx_file, tmp_docx.resolve(), tmp_pdf.resolve()))
 
+        if staged:
             try:
-                convert_to_pdf(tmp_docx.resolve(), tmp_pdf.resolve())
-                if tmp_pdf.exists():
-                    shutil.move(str(tmp_pdf), doc_dir / "reference.pdf")
-                    log.info("OK   %s", h)
-                else:
-                    log.warning("FAIL %s — PDF not created", h)
-                    shutil.rmtree(doc_dir)
+                convert_to_pdf([(tmp_docx, tmp_pdf) for _, tmp_docx, tmp_pdf in staged])
             except Exception as e:
-                log.error("FAIL %s — %s", h, e)
-                shutil.rmtree(doc_dir)
+                error = e
     finally:
+        # Also runs when the batch is interrupted: every PDF Word already wrote is
+        # kept, and a fixture folder only ever gets input.docx alongside its
+        # reference.pdf, so scan_existing never sees a half-made fixture.
+        for docx_file, _, tmp_pdf in staged:
+            h = docx_file.stem
+            doc_dir = SCRAPED_DIR / h
+            if tmp_pdf.exists():
+                doc_dir.mkdir(exist_ok=True)
+                link_or_copy(docx_file, doc_dir / "input.docx")
+                shutil.move(str(tmp_pdf), doc_dir / "reference.pdf")
+                log.info("OK   %s", h)
+                continue
+            if error is not None:
+                log.error("FAIL %s — %s", h, error)
+            else:
+                log.warning("FAIL %s — PDF not created", h)
+            # Drop an input-only folder an earlier interrupted run may have left.
+            if doc_dir.is_dir() and not (doc_dir / "reference.pdf").exists():
+                shutil.rmtree(doc_dir)
         shutil.rmtree(staging)
 
     log.info("Done. Fixtures in %s", SCRAPED_DIR)
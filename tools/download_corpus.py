@@ -4,9 +4,17 @@
 # ///
 
 import argparse
+import itertools
 import logging
+import math
+import mmap
+import os
+import pickle
 import random
+import shutil
 import subprocess
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -15,37 +23,247 @@ log = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SCRAPED_DIR = PROJECT_ROOT / "tests" / "fixtures" / "scraped"
 DEFAULT_MANIFEST = PROJECT_ROOT.parent / "docx-corpus" / "manifest.txt"
+DOWNLOAD_DIR = PROJECT_ROOT / "downloads"
+URL_PREFIX = "https://docxcorp.us/documents/"
+# Hashes the server has answered 404 for, and ones it served as a broken
+# archive; neither is selected again.
+MISSING_FILE = DOWNLOAD_DIR / ".missing.txt"
+INVALID_FILE = DOWNLOAD_DIR / ".invalid.txt"
+# %{exitcode} in --write-out needs curl 7.75.
+CURL_MIN_VERSION = (7, 75)
+# --rate needs curl 7.84.
+CURL_RATE_VERSION = (7, 84)
+CURLE_RANGE_ERROR = "33"
+PART_SUFFIX = ".docx.part"
+_END = object()
+
+
+def curl_version(curl: str) -> tuple[int, ...]:
+    out = subprocess.run([curl, "--version"], capture_output=True, text=True, check=True).stdout
+    # "curl 8.4.0 (x86_64-apple-darwin23.0) libcurl/8.4.0 ..."
+    return tuple(int(part) for part in out.split()[1].split(".")[:2])
+
+
+def curl_quote(value: str) -> str:
+    """Quote a value for a curl config file."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def cached(name: str, source: Path, build):
+    """build(), pickled under downloads/ until source's mtime or size changes."""
+    cache_path = DOWNLOAD_DIR / name
+    st = source.stat()
+    key = (str(source.resolve()), st.st_mtime_ns, st.st_size)
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, value = pickle.load(f)
+        if cached_key == key:
+            return value
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+    value = build()
+    try:
+        DOWNLOAD_DIR.mkdir(exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return value
+
+
+def read_manifest(manifest: Path) -> tuple[str, ...]:
+    # Lines come straight from the page cache; only the kept hashes are decoded.
+    with manifest.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return tuple(h.decode() for h in map(bytes.strip, iter(mm.readline, b"")) if h)
+
+
+def scan_existing() -> frozenset[str]:
+    # DirEntry.is_dir() answers from readdir's d_type; only symlinks still need a stat().
+    with os.scandir(SCRAPED_DIR) as it:
+        return frozenset(e.name for e in it if e.is_dir())
+
+
+def is_valid_docx(path: str) -> bool:
+    """Whether path is a zip archive whose members all pass their CRC check."""
+    try:
+        with zipfile.ZipFile(path) as z:
+            return z.testzip() is None
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def reservoir_sample(items, k: int, rng: random.Random) -> list:
+    """Uniform random sample of up to k items, in one pass and O(k) memory (Algorithm L)."""
+    it = iter(items)
+    reservoir = list(itertools.islice(it, k))
+    if len(reservoir) < k or k == 0:
+        return reservoir
+    w = math.exp(math.log(rng.random()) / k)
+    while True:
+        # Jump straight to the next item that replaces one in the reservoir.
+        skip = math.floor(math.log(rng.random()) / math.log(1 - w))
+        item = next(itertools.islice(it, skip, None), _END)
+        if item is _END:
+            return reservoir
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(rng.random()) / k)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Download random docx files from the corpus.")
     parser.add_argument("count", type=int, help="Number of files to download")
     parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST, help="Path to manifest.txt")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="Maximum concurrent downloads")
+    parser.add_argument("--rps", type=int, help="Cap on requests per second (downloads one at a time)")
+    parser.add_argument("--bps", type=int, help="Cap on total download speed in bytes per second")
+    parser.add_argument("--seed", type=int, help="Seed for a reproducible selection (default: OS entropy)")
     args = parser.parse_args()
 
     if not args.manifest.exists():
         raise SystemExit(f"Manifest not found: {args.manifest}")
 
-    all_hashes = [h.strip() for h in args.manifest.read_text().splitlines() if h.strip()]
-    existing = {p.name for p in SCRAPED_DIR.iterdir() if p.is_dir()} if SCRAPED_DIR.is_dir() else set()
-    available = [h for h in all_hashes if h not in existing]
+    # Both are cached across runs; a directory's mtime changes whenever an entry is added or removed.
+    # They're independent I/O, so on a cache miss the manifest read overlaps the fixture scan.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        manifest_future = pool.submit(cached, ".manifest.cache.pkl", args.manifest, lambda: read_manifest(args.manifest))
+        existing_future = pool.submit(cached, ".scraped.cache.pkl", SCRAPED_DIR, scan_existing) if SCRAPED_DIR.is_dir() else None
+    all_hashes = manifest_future.result()
+    existing = existing_future.result() if existing_future is not None else frozenset()
+    missing = set(MISSING_FILE.read_text().split()) if MISSING_FILE.exists() else set()
+    invalid = set(INVALID_FILE.read_text().split()) if INVALID_FILE.exists() else set()
+
+    # One pass over the manifest: count what's available, set aside partial downloads
+    # left by an interrupted run (finished before picking new hashes), and sample the rest.
+    partial = {p.name.removesuffix(PART_SUFFIX) for p in DOWNLOAD_DIR.glob(f"*{PART_SUFFIX}")}
+    resumed = []
+    available = 0
+
+    def fresh():
+        nonlocal available
+        for h in all_hashes:
+            if h in existing or h in missing or h in invalid:
+                continue
+            available += 1
+            if h in partial:
+                if len(resumed) < args.count:
+                    resumed.append(h)
+                continue
+            yield h
+
+    rng = random.Random(args.seed)
+    stream = fresh()
+    pool = reservoir_sample(stream, args.count, rng)
+    # The sampler can stop early (e.g. for a count of 0); finish the pass so the count is complete.
+    for _ in stream:
+        pass
+
+    log.info(
+        "%d total in manifest, %d already scraped, %d known missing, %d known invalid, %d available",
+        len(all_hashes), len(existing), len(missing), len(invalid), available,
+    )
 
-    log.info("%d total in manifest, %d already scraped, %d available", len(all_hashes), len(existing), len(available))
+    if args.count > available:
+        raise SystemExit(f"Requested {args.count} but only {available} new hashes available")
 
-    if args.count > len(available):
-        raise SystemExit(f"Requested {args.count} but only {len(available)} new hashes available")
+    selected = resumed + rng.sample(pool, args.count - len(resumed))
+    if resumed:
+        log.info("Resuming %d partial downloads", len(resumed))
+    complete = {h for h in selected if (DOWNLOAD_DIR / f"{h}.docx").exists()}
+    if complete:
+        log.info("%d already downloaded", len(complete))
+        selected = [h for h in selected if h not in complete]
+    if not selected:
+        log.info("Nothing to download.")
+        return
 
-    selected = random.sample(available, args.count)
+    # Resolved once up front, for a clear error and no $PATH search per exec.
+    curl = shutil.which("curl")
+    if curl is None:
+        raise SystemExit("curl not found on PATH")
+    version = curl_version(curl)
+    if version < CURL_MIN_VERSION:
+        raise SystemExit(f"curl >= {'.'.join(map(str, CURL_MIN_VERSION))} is required for parallel downloads")
+    if args.rps and version < CURL_RATE_VERSION:
+        raise SystemExit(f"curl >= {'.'.join(map(str, CURL_RATE_VERSION))} is required for --rps")
 
-    download_dir = PROJECT_ROOT / "downloads"
-    download_dir.mkdir(exist_ok=True)
-    log.info("Downloading %d files to %s/", args.count, download_dir)
+    # curl ignores --rate for parallel transfers, so a request-rate cap means going serial.
+    jobs = 1 if args.rps else args.jobs
+    DOWNLOAD_DIR.mkdir(exist_ok=True)
+    log.info("Downloading %d files to %s/ (%d at a time)", len(selected), DOWNLOAD_DIR, jobs)
 
+    # One curl process for the whole batch, so connections are reused across files.
+    # --retry backs off exponentially (honouring Retry-After) on 429 and 5xx.
+    # Each file is fetched under a .part name, continued with a Range request if
+    # one is already there, and only renamed once curl reports it complete.
+    # Plain string paths: curl reports them back verbatim, and no Path is built per file.
+    dest_prefix = os.fspath(DOWNLOAD_DIR) + os.sep
+    config = []
+    part_hashes = {}
+    debug = log.isEnabledFor(logging.DEBUG)
     for h in selected:
-        url = f"https://docxcorp.us/documents/{h}.docx"
-        dest = download_dir / f"{h}.docx"
-        log.info("  %s", h)
-        subprocess.run(["curl", "-s", "-o", str(dest), url], check=True)
+        part = dest_prefix + h + PART_SUFFIX
+        part_hashes[part] = h
+        if debug:
+            log.debug("  %s", h)
+        config.append("url = " + curl_quote(URL_PREFIX + h + ".docx") + "\noutput = " + curl_quote(part) + "\n")
+    cmd = [curl, "--no-progress-meter", "--retry", "3", "--fail", "--continue-at", "-",
+           "--write-out", "%{exitcode} %{http_code} %{filename_effective}\n",
+           # A stream stuck below 1 KB/s for 15 s is dropped and retried from scratch
+           # on a new connection instead of holding up the end of the batch.
+           "--speed-limit", "1024", "--speed-time", "15"]
+    if args.rps:
+        cmd += ["--rate", f"{args.rps}/s"]
+    else:
+        cmd += ["--parallel", "--parallel-max", str(jobs), "--parallel-immediate"]
+    if args.bps:
+        # --limit-rate applies to each transfer, so split the total between them.
+        cmd += ["--limit-rate", str(max(1, args.bps // jobs))]
+    failed = 0
+    reported = 0
+    not_found = []
+    broken = []
+    with subprocess.Popen(cmd + ["-K", "-"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True) as proc:
+        # curl reads the whole config before it starts, so this can't block on stdout.
+        proc.stdin.write("".join(config))
+        proc.stdin.close()
+        # curl reports each transfer as it finishes, so each file is checked while
+        # the rest are still downloading.
+        # Progress every ~2% rather than a line per file.
+        log_every = max(1, len(selected) // 50)
+        for reported, line in enumerate(proc.stdout, 1):
+            if reported % log_every == 0 or reported == len(selected):
+                log.info("  %d/%d", reported, len(selected))
+            code, status, path = line.rstrip("\n").split(" ", 2)
+            if code == "0":
+                if is_valid_docx(path):
+                    os.replace(path, dest_prefix + part_hashes[path] + ".docx")
+                    continue
+                Path(path).unlink()
+                broken.append(part_hashes[path])
+                continue
+            elif status == "404":
+                # Not a failure to retry: recorded below and never selected again.
+                not_found.append(part_hashes[path])
+                continue
+            elif code == CURLE_RANGE_ERROR:
+                # The server can't continue this file; start it over next time.
+                Path(path).unlink(missing_ok=True)
+            failed += 1
+    if not_found:
+        log.warning("%d hashes not on the server; recorded as missing in %s", len(not_found), MISSING_FILE.name)
+        with MISSING_FILE.open("a") as f:
+            f.writelines(f"{h}\n" for h in not_found)
+    if broken:
+        log.warning("%d downloads were not valid docx files; recorded in %s", len(broken), INVALID_FILE.name)
+        with INVALID_FILE.open("a") as f:
+            f.writelines(f"{h}\n" for h in broken)
+    # curl's exit status reflects 404s too; it only matters on its own if some
+    # transfers were never reported at all.
+    if failed or (proc.returncode != 0 and reported < len(selected)):
+        raise SystemExit(f"{failed} download(s) failed (curl exit {proc.returncode}); rerun to retry them")
 
     log.info("Done.")
 
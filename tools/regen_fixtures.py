@@ -0,0 +1,71 @@
+# /// script
+# requires-python = ">=3.9"
+# dependencies = ["python-docx", "lxml", "isal"]
+# ///
+
+import argparse
+import logging
+import os
+import runpy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+log = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CASES_DIR = PROJECT_ROOT / "tests" / "fixtures" / "cases"
+# Generators that need inputs outside the repo; only run when named explicitly.
+UNATTENDED_SKIP = {
+    "case27": "needs the source photos in /tmp/test_images",
+}
+
+
+def find_generators(cases: list[str]) -> list[Path]:
+    """Generator scripts for the given case names, or for every unattended case if none are given."""
+    scripts = sorted(p for pattern in ("*/generate.py", "*/create_*.py") for p in CASES_DIR.glob(pattern))
+    if cases:
+        return [p for p in scripts if p.parent.name in cases]
+    for name, reason in UNATTENDED_SKIP.items():
+        log.info("Skipping %s: %s", name, reason)
+    return [p for p in scripts if p.parent.name not in UNATTENDED_SKIP]
+
+
+def run_generator(script: Path) -> None:
+    # Generators are plain scripts that write relative to the project root.
+    runpy.run_path(str(script), run_name="__main__")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate handcrafted fixture DOCX files in parallel.")
+    parser.add_argument("cases", nargs="*", help="Case names to regenerate (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes")
+    args = parser.parse_args()
+
+    scripts = find_generators(args.cases)
+    if not scripts:
+        raise SystemExit("No generator scripts found")
+
+    log.info("Regenerating %d fixtures with %d workers", len(scripts), args.jobs)
+
+    failed = []
+    # Each worker imports python-docx/lxml once and is reused across scripts.
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=os.chdir, initargs=(PROJECT_ROOT,)) as pool:
+        futures = {pool.submit(run_generator, script): script for script in scripts}
+        for future in as_completed(futures):
+            case = futures[future].parent.name
+            try:
+                future.result()
+            except Exception as e:
+                log.error("  %s failed: %s", case, e)
+                failed.append(case)
+            else:
+                log.info("  %s", case)
+
+    if failed:
+        raise SystemExit(f"{len(failed)} generator(s) failed: {', '.join(sorted(failed))}")
+    log.info("Done.")
+
+
+if __name__ == "__main__":
+    main()